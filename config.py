@@ -11,11 +11,16 @@
 - os.scandir() для эффективного обхода директорий
 - Ленивое создание директорий
 - Минимум системных вызовов
+- Отложенная (debounce) запись настроек: серия set() → одна запись на диск
+- Чтение настроек из плоского dict без прохода через configparser
 """
 
+import atexit
 import configparser
 import os
-from typing import Final
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final, Optional
 
 # ===== КОНСТАНТЫ =====
 CONFIG_FILE: Final[str] = "settings.ini"
@@ -26,6 +31,8 @@ AUDIO_DIR: Final[str] = os.path.join(DATA_DIR, "Audio")
 TEMP_AUDIO_DIR: Final[str] = os.path.join(DATA_DIR, "TempAudio")
 VOCAB_FILE: Final[str] = os.path.join(DATA_DIR, "vocab_20k.txt")
 _MB: Final[int] = 1048576  # Байт в мегабайте (1024 * 1024)
+SAVE_DEBOUNCE_SEC: Final[float] = 0.5  # Задержка отложенной записи settings.ini
+_TRUE: Final[frozenset] = frozenset({'1', 'true', 'yes', 'on', 'y', 't'})  # Truthy строки INI
 
 DEFAULT_CONFIG: Final[dict] = {
     "API": {
@@ -52,16 +59,25 @@ DEFAULT_CONFIG: Final[dict] = {
 
 # ===== ИНИЦИАЛИЗАЦИЯ ДИРЕКТОРИЙ =====
 
+_dirs_ensured = False  # Директории уже созданы в этом процессе
+
+
 def _ensure_directories():
     """
     Ленивое создание директорий - вызывается только при создании ConfigManager.
     Использует exist_ok=True для избежания race conditions.
+
+    Создаются только листовые директории: makedirs сам создает DATA_DIR
+    как родителя. Повторные вызовы в процессе не делают системных вызовов.
     """
-    os.makedirs(DATA_DIR, exist_ok=True)
-    os.makedirs(IMG_DIR, exist_ok=True)
-    os.makedirs(DICT_DIR, exist_ok=True)
-    os.makedirs(AUDIO_DIR, exist_ok=True)
-    os.makedirs(TEMP_AUDIO_DIR, exist_ok=True)
+    global _dirs_ensured
+    if _dirs_ensured:
+        return
+
+    for leaf in (IMG_DIR, DICT_DIR, AUDIO_DIR, TEMP_AUDIO_DIR):
+        os.makedirs(leaf, exist_ok=True)
+
+    _dirs_ensured = True
 
 
 # ===== МЕНЕДЖЕР КОНФИГУРАЦИИ =====
@@ -69,19 +85,54 @@ def _ensure_directories():
 class ConfigManager:
     """
     Управляет конфигурацией приложения с автоматической валидацией и сохранением.
-    Потокобезопасность: Этот класс НЕ потокобезопасен. Используйте singleton 'cfg'.
+
+    Запись на диск отложенная: set() помечает конфиг "грязным" и перезапускает
+    таймер, поэтому шторм обновлений (resize, drag окна) дает одну запись.
+    Несохраненные изменения сбрасываются через flush() и при выходе (atexit).
+
+    Чтение: INI парсится один раз в плоский dict {(section, key): value},
+    get()/get_bool() обслуживаются из него без интерполяции configparser.
+
+    Потокобезопасность: запись защищена RLock (таймер сохраняет из своего потока).
+    Используйте singleton 'cfg'.
     """
 
     def __init__(self):
         _ensure_directories()
         self.config = configparser.ConfigParser()
 
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
+
         if not os.path.exists(CONFIG_FILE):
             self._create_default()
         else:
-            self.config.read(CONFIG_FILE, encoding='utf-8')
+            self._read_file()
             self._validate()
 
+        # Плоский кэш для быстрого чтения (ключи нормализованы optionxform → lowercase)
+        self._flat: dict[tuple[str, str], str] = {
+            (section, key): self.config.get(section, key)
+            for section in self.config.sections()
+            for key in self.config.options(section)
+        }
+
+    def _read_file(self):
+        """
+        Читает settings.ini одним os.read() и парсит через read_string().
+        Файл маленький (<2KB): минуем буферизованный текстовый I/O (TextIOWrapper).
+        O_BINARY на Windows отключает CRLF-трансляцию (configparser сам обрезает \r).
+        """
+        fd = os.open(CONFIG_FILE, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            data = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+
+        self.config.read_string(data.decode('utf-8'), source=CONFIG_FILE)
+
     def _create_default(self):
         """Создает файл конфигурации по умолчанию"""
         for section, options in DEFAULT_CONFIG.items():
@@ -93,15 +144,22 @@ class ConfigManager:
         Валидирует целостность конфигурации и добавляет недостающие ключи.
         Критично для обратной совместимости при добавлении новых настроек.
         """
-        changed = False
+        # Один проход по загруженному конфигу вместо has_section/has_option на каждый ключ
+        existing = {
+            (section, key)
+            for section in self.config.sections()
+            for key in self.config.options(section)
+        }
+
+        missing_sections = [s for s in DEFAULT_CONFIG if not self.config.has_section(s)]
+        for section in missing_sections:
+            self.config.add_section(section)
+        changed = bool(missing_sections)
 
+        optionxform = self.config.optionxform
         for section, options in DEFAULT_CONFIG.items():
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-                changed = True
-
             for key, val in options.items():
-                if not self.config.has_option(section, key):
+                if (section, optionxform(key)) not in existing:
                     self.config.set(section, key, val)
                     changed = True
 
@@ -109,73 +167,197 @@ class ConfigManager:
             self._save()
 
     def _save(self):
-        """Сохраняет конфигурацию на диск"""
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            self.config.write(f)
+        """
+        Немедленно сохраняет конфигурацию на диск.
+
+        Атомарная запись: временный файл рядом + fsync + os.replace(),
+        поэтому settings.ini никогда не остается обрезанным (сбой питания,
+        параллельное чтение).
+        """
+        with self._lock:
+            self._cancel_timer()
+            tmp_path = CONFIG_FILE + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                self.config.write(f)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Атомарная замена (работает на Windows и POSIX)
+            os.replace(tmp_path, CONFIG_FILE)
+            self._dirty = False
+
+    def _cancel_timer(self):
+        """Отменяет запланированное отложенное сохранение"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+
+    def _schedule_save(self):
+        """Помечает конфиг измененным и (пере)запускает таймер отложенной записи"""
+        with self._lock:
+            self._dirty = True
+            self._cancel_timer()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SEC, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Сбрасывает несохраненные изменения на диск (no-op если изменений нет)"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def _set_value(self, section: str, key: str, value) -> None:
+        """Обновляет значение в configparser и в кэшах чтения (без сохранения)"""
+        if not self.config.has_section(section):
+            self.config.add_section(section)
+
+        if type(value) is not str:  # Строки (частый случай) передаем без str()
+            value = str(value)
+        self.config.set(section, key, value)
+
+        self._flat[(section, key.lower())] = value
 
     def get(self, section: str, key: str, fallback=None) -> str:
         """Получает значение конфигурации как строку"""
-        return self.config.get(section, key, fallback=fallback)
+        return self._flat.get((section, key.lower()), fallback)
 
     def get_bool(self, section: str, key: str, fallback=False) -> bool:
-        """Получает значение конфигурации как boolean"""
-        return self.config.getboolean(section, key, fallback=fallback)
+        """
+        Получает значение конфигурации как boolean.
+        Прямая проверка по таблице _TRUE вместо configparser.getboolean().
+        """
+        value = self._flat.get((section, key.lower()))
+        return value.lower() in _TRUE if value is not None else fallback
 
     def set(self, section: str, key: str, value) -> None:
         """
-        Обновляет значение конфигурации и сохраняет на диск.
-        Примечание: Каждый set() вызывает файловый I/O. Для пакетных обновлений
-        рассмотрите реализацию метода set_batch().
+        Обновляет значение конфигурации с отложенным сохранением на диск.
+        Серия вызовов в пределах SAVE_DEBOUNCE_SEC дает одну запись.
         """
-        if not self.config.has_section(section):
-            self.config.add_section(section)
+        with self._lock:
+            self._set_value(section, key, value)
+            self._schedule_save()
 
-        self.config.set(section, key, str(value))
-        self._save()
+    def set_batch(self, updates: dict[tuple[str, str], object]) -> None:
+        """
+        Применяет несколько обновлений с одним отложенным сохранением,
+        как set(): запись на диск уходит из UI-потока в таймер.
+
+        Args:
+            updates: {(section, key): value}
+        """
+        with self._lock:
+            for (section, key), value in updates.items():
+                self._set_value(section, key, value)
+            self._schedule_save()
 
 
 # ===== УТИЛИТЫ КЭША =====
 
+def _iter_files(root: str):
+    """
+    Обходит дерево директорий через os.scandir() и отдает DirEntry файлов.
+
+    Итеративный обход с явным стеком: один Python-фрейм на весь обход
+    вместо фрейма на каждую поддиректорию.
+    DirEntry уже содержит тип записи из readdir, поэтому is_dir()
+    не требует отдельного stat(), а entry.stat() кэширует свой результат.
+    Недоступные/отсутствующие директории (включая root) пропускаются.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            entries_cm = os.scandir(path)
+        except OSError:
+            continue
+
+        with entries_cm as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield entry
+                except OSError:
+                    # Запись удалена/недоступна во время итерации - пропускаем
+                    continue
+
+
 def get_cache_size_mb() -> float:
     """
     Вычисляет общий размер директории кэша в мегабайтах.
 
     Оптимизации:
-    - Один проход os.walk()
-    - Без избыточных os.path.exists() (walk гарантирует существование)
+    - Итеративный обход os.scandir() вместо os.walk() + os.path.getsize()
+    - Размер берется из DirEntry.stat() (~N системных вызовов вместо 2N)
     - Graceful обработка недоступных файлов
+    - Без предварительного os.path.exists(): отсутствующий DATA_DIR
+      просто дает пустой обход
 
     Returns:
         Размер кэша в MB с округлением до 1 знака
     """
-    if not os.path.exists(DATA_DIR):
+    total_size = 0
+
+    try:
+        for entry in _iter_files(DATA_DIR):
+            try:
+                total_size += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                # Файл удален/недоступен во время итерации - пропускаем
+                continue
+    except OSError:
+        # Ошибка чтения директории во время итерации
         return 0.0
 
-    total_size = 0
+    return round(total_size / _MB, 1)
+
+
+def _clear_dir(subdir: str) -> int:
+    """
+    Удаляет все файлы в одной директории кэша (без рекурсии).
+
+    Returns:
+        Количество успешно удаленных файлов
+    """
+    # Без предварительного os.path.exists(): один вызов scandir вместо двух
+    try:
+        entries_cm = os.scandir(subdir)
+    except OSError:
+        # Директории нет (FileNotFoundError) или нет доступа - пропускаем
+        return 0
+
+    deleted_count = 0
 
     try:
-        for dirpath, _, filenames in os.walk(DATA_DIR):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
+        # os.scandir() в 2-3 раза быстрее чем os.listdir() + os.path.isfile()
+        with entries_cm as entries:
+            for entry in entries:
+                # Без предварительного is_file(): в директориях кэша только файлы,
+                # а unlink() поддиректории просто завершится ошибкой
                 try:
-                    total_size += os.path.getsize(filepath)
+                    os.unlink(entry.path)
+                    deleted_count += 1
                 except OSError:
-                    # Файл удален/недоступен во время итерации - пропускаем
+                    # Поддиректория / файл заблокирован или удален другим процессом
                     continue
     except OSError:
-        # Ошибка доступа к корневой директории
-        return 0.0
+        # Ошибка чтения директории во время итерации - возвращаем что успели
+        pass
 
-    return round(total_size / _MB, 1)
+    return deleted_count
 
 
 def clear_cache() -> int:
     """
     Удаляет все закэшированные файлы с сохранением структуры директорий.
 
-    Оптимизация: Использует os.scandir() вместо listdir() + isfile()
-    - scandir() возвращает DirEntry объекты с кэшированными результатами stat()
-    - Устраняет избыточные системные вызовы (2x улучшение производительности)
+    Оптимизации:
+    - os.scandir() + прямой os.unlink() без лишнего stat() на каждый файл
+    - Поддиректории очищаются параллельно в ThreadPoolExecutor:
+      unlink - I/O-bound операция, системные вызовы в разных директориях перекрываются
 
     Сохраняет:
     - vocab_20k.txt (в корне DATA_DIR)
@@ -184,29 +366,10 @@ def clear_cache() -> int:
     Returns:
         Количество успешно удаленных файлов
     """
-    deleted_count = 0
+    subdirs = (IMG_DIR, DICT_DIR, AUDIO_DIR, TEMP_AUDIO_DIR)
 
-    for subdir in (IMG_DIR, DICT_DIR, AUDIO_DIR, TEMP_AUDIO_DIR):
-        if not os.path.exists(subdir):
-            continue
-
-        try:
-            # os.scandir() в 2-3 раза быстрее чем os.listdir() + os.path.isfile()
-            # потому что DirEntry кэширует результаты stat()
-            with os.scandir(subdir) as entries:
-                for entry in entries:
-                    if entry.is_file():
-                        try:
-                            os.unlink(entry.path)
-                            deleted_count += 1
-                        except OSError:
-                            # Файл заблокирован/удален другим процессом - пропускаем
-                            continue
-        except OSError:
-            # Ошибка доступа к директории - пропускаем всю директорию
-            continue
-
-    return deleted_count
+    with ThreadPoolExecutor(max_workers=len(subdirs)) as executor:
+        return sum(executor.map(_clear_dir, subdirs))
 
 
 # ===== SINGLETON ЭКЗЕМПЛЯР =====
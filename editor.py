@@ -1,36 +1,79 @@
 class TextEditorSimulator:
+    # Gap buffer: символы слева от курсора лежат в self.left в прямом порядке,
+    # символы справа — в self.right в ОБРАТНОМ порядке (ближайший к курсору в конце).
+    # Вставка/удаление/перемещение курсора — амортизированно O(1).
+    #
+    # Хранилище: bytearray для ASCII (компактно, decode вместо поэлементного join),
+    # при первом не-ASCII символе буфер переключается на list[str] до clear().
     def __init__(self):
-        self.chars = []
-        self.cursor = 0
+        self.left = bytearray()
+        self.right = bytearray()
+        self._ascii = True
+        # Кэш результатов get_text()/get_text_with_cursor(), сбрасывается при изменениях
+        self._cached_text = None
+        self._cached_with_cursor = None
+
+    @property
+    def cursor(self):
+        return len(self.left)
+
+    def _invalidate(self):
+        self._cached_text = None
+        self._cached_with_cursor = None
+
+    def _switch_to_unicode(self):
+        self.left = list(self.left.decode("ascii"))
+        self.right = list(self.right.decode("ascii"))
+        self._ascii = False
 
     def insert(self, text):
-        for char in text:
-            self.chars.insert(self.cursor, char)
-            self.cursor += 1
+        if self._ascii:
+            try:
+                self.left.extend(text.encode("ascii"))
+            except UnicodeEncodeError:
+                self._switch_to_unicode()
+                self.left.extend(text)
+        else:
+            self.left.extend(text)
+        self._invalidate()
 
     def backspace(self):
-        if self.cursor > 0:
-            self.chars.pop(self.cursor - 1)
-            self.cursor -= 1
+        if self.left:
+            self.left.pop()
+            self._invalidate()
 
     def delete(self):
-        if self.cursor < len(self.chars):
-            self.chars.pop(self.cursor)
+        if self.right:
+            self.right.pop()
+            self._invalidate()
 
     def move_left(self):
-        if self.cursor > 0: self.cursor -= 1
+        if self.left:
+            self.right.append(self.left.pop())
+            self._cached_with_cursor = None  # Текст не изменился, только курсор
 
     def move_right(self):
-        if self.cursor < len(self.chars): self.cursor += 1
-        
+        if self.right:
+            self.left.append(self.right.pop())
+            self._cached_with_cursor = None  # Текст не изменился, только курсор
+
     def clear(self):
-        self.chars = []
-        self.cursor = 0
+        self.left = bytearray()
+        self.right = bytearray()
+        self._ascii = True
+        self._invalidate()
 
     def get_text(self):
-        return "".join(self.chars)
-    
+        if self._cached_text is None:
+            if self._ascii:
+                self._cached_text = self.left.decode("ascii") + self.right[::-1].decode("ascii")
+            else:
+                self._cached_text = "".join(self.left) + "".join(reversed(self.right))
+        return self._cached_text
+
     def get_text_with_cursor(self):
-        temp = self.chars.copy()
-        temp.insert(self.cursor, "|")
-        return "".join(temp)
+        if self._cached_with_cursor is None:
+            text = self.get_text()
+            cursor = self.cursor
+            self._cached_with_cursor = text[:cursor] + "|" + text[cursor:]
+        return self._cached_with_cursor
@@ -7,7 +7,7 @@
 """
 
 import tkinter as tk
-from typing import Callable
+from typing import Callable, Optional
 from config import cfg
 from gui.styles import COLORS
 
@@ -52,6 +52,12 @@ class ToggleButton(tk.Label):
         self.config_key = config_key
         self.command = command
 
+        # Какие цвета сейчас отображаются: True — яркие (enabled/hover), False — приглушенные.
+        # None — ещё не применялись. Позволяет пропускать лишние config() на Leave.
+        self._last_enabled: Optional[bool] = None
+        # Последнее прочитанное из config значение; сбрасывается в sync_state()
+        self._cached_state: Optional[bool] = None
+
         # Привязка событий
         self.bind("<Button-1>", self._on_click)
         self.bind("<Enter>", self._on_enter)
@@ -67,12 +73,14 @@ class ToggleButton(tk.Label):
         self.sync_state()
 
     def _on_enter(self, event):
-        """Hover эффект: всегда яркая кнопка"""
-        self.config(bg=COLORS["text_accent"], fg=COLORS["bg"])
+        """Hover эффект: всегда яркая кнопка (те же цвета, что у enabled)"""
+        if self._last_enabled is not True:
+            self.config(bg=COLORS["text_accent"], fg=COLORS["bg"])
+            self._last_enabled = True
 
     def _on_leave(self, event):
-        """Возврат к состоянию на основе config"""
-        self.sync_state()
+        """Возврат к состоянию на основе config (без повторного чтения config)"""
+        self._apply_state()
 
     def sync_state(self):
         """
@@ -83,7 +91,17 @@ class ToggleButton(tk.Label):
         - После клика (для обновления визуального состояния)
         - При программном изменении config извне
         """
-        is_enabled = cfg.get_bool("USER", self.config_key, True)
+        self._cached_state = None
+        self._apply_state()
+
+    def _apply_state(self):
+        """Применяет цвета по закэшированному состоянию (config читается только после сброса кэша)"""
+        if self._cached_state is None:
+            self._cached_state = cfg.get_bool("USER", self.config_key, True)
+        is_enabled = self._cached_state
+        if is_enabled == self._last_enabled:
+            return  # Цвета уже соответствуют состоянию
+        self._last_enabled = is_enabled
         self.config(
             bg=COLORS["text_accent"] if is_enabled else COLORS["bg_secondary"],
             fg=COLORS["bg"] if is_enabled else COLORS["text_faint"]
@@ -100,6 +118,10 @@ class ActionButton(tk.Label):
     - Используется для команд: "Clear Cache", "Export", etc.
     """
 
+    # Цвета состояний вычисляются один раз при импорте, а не на каждый hover
+    _NORMAL_COLORS = {"bg": COLORS["bg_secondary"], "fg": COLORS["text_main"]}
+    _HOVER_COLORS = {"bg": COLORS["text_accent"], "fg": COLORS["bg"]}
+
     def __init__(self, parent: tk.Widget, text: str, command: Callable, **kwargs):
         """
         Args:
@@ -111,8 +133,7 @@ class ActionButton(tk.Label):
         # Настройки по умолчанию
         defaults = {
             "font": ("Segoe UI", 8),
-            "bg": COLORS["bg_secondary"],
-            "fg": COLORS["text_main"],
+            **self._NORMAL_COLORS,
             "cursor": "hand2",
             "padx": 8,
             "pady": 3,
@@ -131,8 +152,8 @@ class ActionButton(tk.Label):
 
     def _on_enter(self, event):
         """Hover эффект: яркая кнопка"""
-        self.config(bg=COLORS["text_accent"], fg=COLORS["bg"])
+        self.config(**self._HOVER_COLORS)
 
     def _on_leave(self, event):
         """Возврат к обычному состоянию"""
-        self.config(bg=COLORS["bg_secondary"], fg=COLORS["text_main"])
+        self.config(**self._NORMAL_COLORS)
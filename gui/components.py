@@ -69,6 +69,11 @@ class TranslationTooltip:
     - Позиционирование относительно курсора
     """
 
+    # Ровно 4 кадра: индекс кадра считается как step & 3
+    SPINNER_CHARS = ("|", "/", "-", "\\")
+    # Готовые строки кадров — без форматирования на каждом тике
+    _SPINNER_TEXTS = tuple(f"{c} Translating..." for c in SPINNER_CHARS)
+
     def __init__(self, parent):
         """
         Args:
@@ -77,20 +82,30 @@ class TranslationTooltip:
         self.parent = parent
         self.tip_window = None
         self.label = None
+        self._visible = False  # Окно создаётся один раз и дальше только скрывается/показывается
         self.animation_id = None
-        self.spinner_chars = ["|", "/", "-", "\\"]
+        self._step = 0  # Текущий кадр спиннера
+        self._animating = False
 
     def _create_window(self, x, y):
-        """Создаёт всплывающее окно с рамкой"""
-        if self.tip_window:
-            return
+        """
+        Показывает всплывающее окно рядом с курсором.
+
+        Toplevel с рамкой создаётся при первом показе, дальше переиспользуется
+        (withdraw/deiconify вместо destroy/create). Уничтожается вместе с parent.
+        """
+        if self.tip_window is None:
+            self._build_window()
 
-        x += 15
-        y += 15
+        self.tip_window.wm_geometry(f"+{x + 15}+{y + 15}")
+        self.tip_window.deiconify()
+        self._visible = True
 
+    def _build_window(self):
+        """Создаёт скрытое окно с рамкой и Label"""
         self.tip_window = tk.Toplevel(self.parent)
+        self.tip_window.withdraw()
         self.tip_window.wm_overrideredirect(True)
-        self.tip_window.wm_geometry(f"+{x}+{y}")
         self.tip_window.wm_attributes("-topmost", True)
 
         frame = tk.Frame(
@@ -118,7 +133,9 @@ class TranslationTooltip:
         """Показывает окно с анимированным спиннером"""
         self.hide()
         self._create_window(x, y)
-        self._animate(0)
+        self._step = 0
+        self._animating = True
+        self._animate()
 
     def show_text(self, text, x, y):
         """Показывает окно с готовым текстом"""
@@ -127,29 +144,34 @@ class TranslationTooltip:
         self.label.config(text=text)
 
     def update_text(self, text):
-        """Обновляет текст в существующем окне (останавливает анимацию)"""
-        if self.tip_window and self.label:
+        """
+        Подставляет загруженный перевод вместо спиннера (останавливает анимацию).
+
+        Применяется только пока идёт загрузка: после hide()/show_text() или
+        повторного update_text() запоздавший результат игнорируется.
+        """
+        if self._animating and self._visible:
             self._stop_animation()
             self.label.config(text=text)
 
-    def _animate(self, step):
-        """Анимация спиннера загрузки"""
-        if not self.tip_window:
+    def _animate(self):
+        """Анимация спиннера загрузки (кадр хранится в self._step, без lambda на тик)"""
+        if not self._animating or not self._visible:
             return
-        char = self.spinner_chars[step % len(self.spinner_chars)]
-        self.label.config(text=f"{char} Translating...")
-        self.animation_id = self.parent.after(100, lambda: self._animate(step + 1))
+        self.label.config(text=self._SPINNER_TEXTS[self._step & 3])  # 4 кадра
+        self._step += 1
+        self.animation_id = self.parent.after(100, self._animate)
 
     def _stop_animation(self):
         """Останавливает анимацию"""
+        self._animating = False
         if self.animation_id:
             self.parent.after_cancel(self.animation_id)
             self.animation_id = None
 
     def hide(self):
-        """Скрывает и уничтожает окно"""
+        """Скрывает окно (без уничтожения — оно переиспользуется)"""
         self._stop_animation()
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
-            self.label = None
+        if self._visible:
+            self.tip_window.withdraw()
+            self._visible = False
@@ -13,7 +13,11 @@ Responsibilities:
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 import threading
+import queue
+import json
+from functools import lru_cache
 from typing import Dict, List, Optional, Callable
 from gui.styles import COLORS, FONTS
 from gui.scrollbar import CustomScrollbar
@@ -74,6 +78,7 @@ FORM_LABELS = {
 }
 
 
+@lru_cache(maxsize=64)
 def get_upos(pos: str) -> Optional[str]:
     """
     Получает UPOS тег для части речи с fallback на None для неизвестных.
@@ -87,7 +92,8 @@ def get_upos(pos: str) -> Optional[str]:
     return POS_TO_UPOS.get(pos.lower(), None)
 
 
-def get_word_forms(word: str, pos: str) -> list[str]:
+@lru_cache(maxsize=4096)
+def get_word_forms(word: str, pos: str) -> tuple[tuple[str, str], ...]:
     """
     Получает словоформы через lemminflect с многоуровневым fallback.
 
@@ -101,21 +107,25 @@ def get_word_forms(word: str, pos: str) -> list[str]:
     - "included" (verb) → лемма="include" → формы глагола ✅
     - "included" (adj) → лемма="included" или пусто → fallback на само слово → формы прилагательного ✅
 
+    Результат кэшируется: за один рендер формы запрашиваются для каждой
+    основной части речи (_get_lemminflect_parts) и повторно для вкладок.
+    Поэтому результат неизменяемый — tuple.
+
     Args:
         word: Слово для генерации форм
         pos: Часть речи из dictionaryapi.dev
 
     Returns:
-        Список строк вида "Label: form" или пустой список
+        Пары (label, form), например ("Past", "included"), или пустой tuple
     """
     # Проверяем доступность библиотеки
     if not LEMMINFLECT_AVAILABLE:
-        return []
+        return ()
 
     # Получаем UPOS тег
     upos = get_upos(pos)
     if upos is None:
-        return []
+        return ()
 
     try:
         # ШАГ 1: Получаем лемму (базовую форму)
@@ -131,9 +141,9 @@ def get_word_forms(word: str, pos: str) -> list[str]:
             forms_dict = lemminflect.getAllInflections(word, upos=upos)
 
         if not forms_dict:
-            return []
+            return ()
 
-        # Конвертируем в список строк "Label: form"
+        # Конвертируем в пары (label, form)
         result = []
         for tag, forms_tuple in sorted(forms_dict.items()):
             label = FORM_LABELS.get(tag, tag)
@@ -145,13 +155,13 @@ def get_word_forms(word: str, pos: str) -> list[str]:
                 form = forms_tuple[0] if forms_tuple else ""
 
             if form:
-                result.append(f"{label}: {form}")
+                result.append((label, form))
 
-        return result
+        return tuple(result)
 
     except Exception:
-        # Любая ошибка lemminflect → возвращаем пустой список
-        return []
+        # Любая ошибка lemminflect → возвращаем пустой результат
+        return ()
 
 
 class CustomTabBar(tk.Frame):
@@ -164,6 +174,14 @@ class CustomTabBar(tk.Frame):
     - Disabled состояние для пустых вкладок
     """
 
+    # Готовые наборы опций для set_active_tab (шрифт у всех вкладок одинаковый — не трогаем)
+    _ACTIVE_BTN = {"bg": COLORS["bg"], "fg": COLORS["text_accent"]}
+    _INACTIVE_BTN = {"bg": COLORS["bg_secondary"], "fg": COLORS["text_main"]}
+    _ACTIVE_BORDER = {"bg": COLORS["text_accent"]}  # Желтая граница 1px
+    _INACTIVE_BORDER = {"bg": COLORS["bg_secondary"]}
+    _HOVER_BG = "#353739"  # Немного светлее фона полосы
+    _IDLE_BG = COLORS["bg_secondary"]
+
     def __init__(self, parent, tabs: List[str], on_tab_change: Callable):
         """
         Args:
@@ -205,12 +223,18 @@ class CustomTabBar(tk.Frame):
             border = tk.Frame(container, height=1, bg=COLORS["bg_secondary"])
             border.pack(side="bottom", fill="x")
 
-            btn.bind("<Button-1>", lambda e, i=idx: self._on_tab_click(i))
-            btn.bind("<Enter>", lambda e, b=btn, i=idx: self._on_hover_enter(b, i))
-            btn.bind("<Leave>", lambda e, b=btn, i=idx: self._on_hover_leave(b, i))
+            # Индекс хранится на самой кнопке: обработчики — методы, без замыкания на событие
+            btn._tab_idx = idx
+            btn.bind("<Button-1>", self._on_tab_button_click)
+            btn.bind("<Enter>", self._on_hover_enter)
+            btn.bind("<Leave>", self._on_hover_leave)
 
             self.tab_buttons.append((btn, border, container))
 
+    def _on_tab_button_click(self, event):
+        """Клик по кнопке-вкладке"""
+        self._on_tab_click(event.widget._tab_idx)
+
     def _on_tab_click(self, idx: int):
         """Обработка клика по вкладке"""
         if idx in self.disabled_tabs:
@@ -227,24 +251,19 @@ class CustomTabBar(tk.Frame):
         Args:
             idx: Индекс вкладки
         """
+        if idx == self.active_tab:
+            return  # Вкладка уже активна — ничего не перекрашиваем
+
         # Сброс предыдущей активной вкладки (ТОЛЬКО ЕСЛИ ЕСТЬ)
         if self.active_tab is not None:
             old_btn, old_border, old_container = self.tab_buttons[self.active_tab]
-            old_btn.config(
-                bg=COLORS["bg_secondary"],
-                fg=COLORS["text_main"],
-                font=FONTS["definition"]
-            )
-            old_border.config(bg=COLORS["bg_secondary"])
+            old_btn.config(**self._INACTIVE_BTN)
+            old_border.config(**self._INACTIVE_BORDER)
 
         # Установка новой активной вкладки
         new_btn, new_border, new_container = self.tab_buttons[idx]
-        new_btn.config(
-            bg=COLORS["bg"],
-            fg=COLORS["text_accent"],
-            font=FONTS["definition"]
-        )
-        new_border.config(bg=COLORS["text_accent"])  # Желтая граница 1px
+        new_btn.config(**self._ACTIVE_BTN)
+        new_border.config(**self._ACTIVE_BORDER)
 
         self.active_tab = idx
 
@@ -271,15 +290,26 @@ class CustomTabBar(tk.Frame):
                 cursor="hand2"
             )
 
-    def _on_hover_enter(self, btn: tk.Label, idx: int):
+    def reset(self):
+        """Возвращает все вкладки в исходное состояние: неактивные и enabled"""
+        for btn, border, container in self.tab_buttons:
+            btn.config(cursor="hand2", **self._INACTIVE_BTN)
+            border.config(**self._INACTIVE_BORDER)
+        self.disabled_tabs.clear()
+        self.active_tab = None
+
+    def _on_hover_enter(self, event):
         """Hover эффект для неактивных вкладок"""
+        btn = event.widget
+        idx = btn._tab_idx
         if idx != self.active_tab and idx not in self.disabled_tabs:
-            btn.config(bg="#353739")  # Немного светлее
+            btn.config(bg=self._HOVER_BG)
 
-    def _on_hover_leave(self, btn: tk.Label, idx: int):
+    def _on_hover_leave(self, event):
         """Уход курсора с неактивной вкладки"""
-        if idx != self.active_tab:
-            btn.config(bg=COLORS["bg_secondary"])
+        btn = event.widget
+        if btn._tab_idx != self.active_tab:
+            btn.config(bg=self._IDLE_BG)
 
 
 class CustomNotebook(tk.Frame):
@@ -301,7 +331,8 @@ class CustomNotebook(tk.Frame):
         """
         super().__init__(parent, bg=COLORS["bg"])
 
-        self.tabs_data = {}  # {idx: frame}
+        self.tabs_data = {}  # {idx: frame} — только уже построенные вкладки
+        self._tab_factories = {}  # {idx: factory} — вкладки, которые ещё не открывались
         self.current_frame = None
         self.pos_order = pos_order
         self.on_tab_switch_callback = on_tab_switch_callback
@@ -318,21 +349,37 @@ class CustomNotebook(tk.Frame):
         self.content_area = tk.Frame(self, bg=COLORS["bg"])
         self.content_area.pack(side="top", fill="both", expand=True)
 
-    def add_tab(self, idx: int, content_frame: tk.Frame, disabled: bool = False):
+    def add_tab(self, idx: int, factory: Callable[[], tk.Frame], disabled: bool = False):
         """
-        Добавляет вкладку.
+        Добавляет вкладку с отложенным построением.
+
+        Содержимое создаётся factory() при первом show_tab(idx):
+        вкладки, которые пользователь не открыл, не стоят ничего.
 
         Args:
             idx: Индекс вкладки
-            content_frame: Frame с содержимым вкладки
+            factory: Функция, создающая Frame с содержимым вкладки (родитель — content_area)
             disabled: True если вкладка пустая
         """
-        self.tabs_data[idx] = content_frame
-        content_frame.pack_forget()  # Скрываем по умолчанию
+        self._tab_factories[idx] = factory
 
         if disabled:
             self.tab_bar.set_tab_disabled(idx, True)
 
+    def reset(self):
+        """
+        Готовит notebook к повторному использованию с новыми данными.
+
+        Уничтожается только содержимое построенных вкладок; tab bar и
+        content area остаются.
+        """
+        for frame in self.tabs_data.values():
+            frame.destroy()
+        self.tabs_data.clear()
+        self._tab_factories.clear()
+        self.current_frame = None
+        self.tab_bar.reset()
+
     def show_tab(self, idx: int):
         """
         Показывает вкладку.
@@ -344,6 +391,11 @@ class CustomNotebook(tk.Frame):
         if self.current_frame:
             self.current_frame.pack_forget()
 
+        # Строим вкладку при первом показе
+        factory = self._tab_factories.pop(idx, None)
+        if factory is not None:
+            self.tabs_data[idx] = factory()
+
         # Показываем новый frame
         self.current_frame = self.tabs_data[idx]
         self.current_frame.pack(in_=self.content_area, fill="both", expand=True)
@@ -377,6 +429,7 @@ class DictionaryRenderer:
     # Константы для группировки частей речи
     MAJOR_POS = {"noun", "verb", "adjective", "adverb"}
     POS_ORDER = ["noun", "verb", "adjective", "adverb", "other"]
+    POS_INDEX: Dict[str, int] = {pos: idx for idx, pos in enumerate(POS_ORDER)}  # pos → индекс вкладки
     POS_LABELS = {
         "noun": "NOUN",
         "verb": "VERB",
@@ -385,10 +438,19 @@ class DictionaryRenderer:
         "other": "OTHER"
     }
 
+    # Bindtag общего mousewheel-обработчика для всех виджетов словаря
+    _SCROLL_TAG = "DictScroll"
+
+    # Цвета подсветки синонима/антонима под курсором (тег "hover")
+    _WORD_HOVER_BG = "#FFD700"
+    _WORD_HOVER_FG = "#000000"
+
+    # Bindtag hover-перевода определений и примеров
+    _HOVER_TAG = "DictHover"
+
     def __init__(self,
                  parent_frame: tk.Frame,
                  get_content_width: Callable[[], int],
-                 bind_hover_translation: Callable[[tk.Widget, str], None],
                  on_synonym_click: Callable[[str], None],
                  on_synonym_enter: Callable,
                  on_synonym_leave: Callable,
@@ -398,16 +460,14 @@ class DictionaryRenderer:
         Args:
             parent_frame: Scrollable frame для рендеринга
             get_content_width: Функция получения ширины контента
-            bind_hover_translation: Функция привязки hover-перевода
             on_synonym_click: Callback для клика по синониму
-            on_synonym_enter: Callback для hover на синониме
-            on_synonym_leave: Callback для leave с синонима
+            on_synonym_enter: Callback hover-перевода (синонимы, определения, примеры)
+            on_synonym_leave: Callback ухода курсора с переводимого текста
             canvas_scroll: Canvas для управления прокруткой (legacy, не используется)
             main_window: Ссылка на MainWindow для обновления картинки
         """
         self.parent = parent_frame
         self.get_content_width = get_content_width
-        self.bind_hover_translation = bind_hover_translation
         self.on_synonym_click = on_synonym_click
         self.on_synonym_enter = on_synonym_enter
         self.on_synonym_leave = on_synonym_leave
@@ -415,12 +475,119 @@ class DictionaryRenderer:
         self.main_window = main_window
 
         self.current_word = ""  # Текущее слово для lemminflect
+
+        # Единый контейнер отрисованного контента: clear() уничтожает только его
+        self._content: Optional[tk.Frame] = None
+
+        # Последний отрисованный notebook: при повторном рендере тех же данных
+        # (то же слово, та же ширина) скрытый контент показывается снова без пересоздания
+        self._last_rendered_key: Optional[tuple] = None
+        self._last_notebook: Optional["CustomNotebook"] = None
+        self._last_first_active = 0
+        self._last_image_word = ""
+        self._cached_content: Optional[tk.Frame] = None  # Спрятанный clear()'ом контент
+
+        # Один class-биндинг mousewheel на все виджеты словаря вместо bind() на каждый
+        parent_frame.bind_class(self._SCROLL_TAG, "<MouseWheel>", self._on_scroll_tag_mousewheel)
+
+        # Hover-перевод определений/примеров: тоже class-биндинг, без замыкания на каждый Label
+        parent_frame.bind_class(self._HOVER_TAG, "<Enter>", self._on_hover_tag_enter)
+        parent_frame.bind_class(self._HOVER_TAG, "<Leave>", self._on_hover_tag_leave)
+
+        # Построитель содержимого для каждой вкладки: ветка по "other" решается один раз
+        self._tab_builders = tuple(
+            self._create_other_tab_content if pos == "other" else self._create_major_tab_content
+            for pos in self.POS_ORDER
+        )
+
+        # Шрифт для измерения ширины синонимов/антонимов без geometry-прохода Tk
+        self._def_font = tkfont.Font(font=FONTS["definition"])
         self._audio_playing = False  # Флаг воспроизведения аудио (защита от наложения)
 
+        # Один постоянный worker-поток для озвучки вместо нового потока на каждый клик
+        self._audio_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._audio_thread = threading.Thread(target=self._audio_loop, daemon=True)
+        self._audio_thread.start()
+
     def clear(self):
-        """Очищает все виджеты из scrollable frame"""
-        for widget in self.parent.winfo_children():
-            widget.destroy()
+        """
+        Очищает отрисованный контент.
+        Один destroy() контейнера вместо destroy() каждого дочернего виджета.
+
+        Контент с notebook'ом не уничтожается сразу, а прячется до следующего
+        render(): если придут те же данные, он будет показан снова, иначе
+        notebook будет переиспользован для новых данных.
+        """
+        if self._content is None:
+            return
+
+        self._drop_cached_content()
+        if self._last_notebook is not None:
+            self._content.pack_forget()
+            self._cached_content = self._content
+        else:
+            self._content.destroy()
+        self._content = None
+
+    def _drop_cached_content(self):
+        """Уничтожает спрятанный контент предыдущего рендера"""
+        if self._cached_content is not None:
+            self._cached_content.destroy()
+            self._cached_content = None
+
+    def _restore_cached_render(self) -> bool:
+        """
+        Показывает последний notebook без пересоздания виджетов.
+
+        Returns:
+            True если контент восстановлен
+        """
+        if self._content is None:
+            if self._cached_content is None:
+                return False
+            self._content, self._cached_content = self._cached_content, None
+            self._content.pack(fill="both", expand=True)
+
+        self._last_notebook.show_tab(self._last_first_active)
+        self._load_image_for_word(self._last_image_word)
+        return True
+
+    def _recycle_content(self) -> Optional["CustomNotebook"]:
+        """
+        Берёт спрятанный контент предыдущего рендера для нового рендера.
+
+        Если в нём есть notebook, контейнер и notebook (tab bar, content area)
+        переиспользуются — пересоздаётся только содержимое вкладок.
+        Иначе создаётся пустой контейнер.
+
+        Returns:
+            Notebook для повторного использования или None
+        """
+        notebook = self._last_notebook
+        self._last_notebook = None
+        if notebook is not None and self._cached_content is not None:
+            self._content, self._cached_content = self._cached_content, None
+            return notebook
+
+        self._drop_cached_content()
+        self._create_content()
+        return None
+
+    @staticmethod
+    def _discard_notebook(notebook: Optional["CustomNotebook"]):
+        """Уничтожает переиспользованный notebook, если рендер обходится без него"""
+        if notebook is not None:
+            notebook.destroy()
+
+    def _create_content(self) -> tk.Frame:
+        """
+        Создаёт пустой контейнер для нового рендера.
+
+        Контейнер не упакован: виджеты собираются в немаппированном фрейме,
+        а pack() выполняется один раз в конце render().
+        """
+        self._content = tk.Frame(self.parent, bg=COLORS["bg"])
+        return self._content
 
     def _get_base_form_for_pos(self, word: str, pos: str) -> str:
         """
@@ -438,10 +605,7 @@ class DictionaryRenderer:
 
         forms = get_word_forms(word, pos)
         if forms:
-            first_form = forms[0]
-            parts = first_form.split(": ", 1)
-            if len(parts) == 2:
-                return parts[1].strip()
+            return forms[0][1].strip()
 
         return word
 
@@ -477,31 +641,6 @@ class DictionaryRenderer:
 
         threading.Thread(target=worker, daemon=True).start()
 
-    def _get_first_active_pos(self, merged_meanings: List[Dict], grouped: Dict[str, Optional[Dict]]) -> str:
-        """
-        Определяет часть речи первой активной вкладки.
-
-        Args:
-            merged_meanings: Meanings от API
-            grouped: Сгруппированные meanings (включая lemminflect_only)
-
-        Returns:
-            Часть речи первой активной вкладки (noun, verb, adjective, adverb, other)
-        """
-        # Приоритет 1: Первая часть речи от API
-        if merged_meanings:
-            first_pos = merged_meanings[0].get("partOfSpeech", "").lower()
-            if first_pos in self.MAJOR_POS:
-                return first_pos
-
-        # Приоритет 2: Первая активная вкладка в порядке NOUN → VERB → ADJ → ADV → OTHER
-        for pos in self.POS_ORDER:
-            if grouped[pos] is not None:
-                return pos
-
-        # Fallback (не должно произойти)
-        return "other"
-
     def _on_tab_switched(self, pos: str):
         """
         Callback при переключении вкладки → обновление картинки.
@@ -526,41 +665,72 @@ class DictionaryRenderer:
         Args:
             full_data: Данные от dictionaryapi.dev или None
         """
-        self.clear()
+        # Ширина контента — один winfo-запрос на рендер вместо запроса на каждый Label
+        content_width = self.get_content_width()
 
-        # КРИТИЧНО: Если full_data = None, показываем no data
-        if not full_data:
-            self._render_no_data()
-            self._load_image_for_word(self.current_word)
-            return
+        # Те же данные при той же ширине → показываем уже построенный notebook
+        render_key = None
+        if full_data:
+            render_key = (json.dumps(full_data, sort_keys=True), content_width)
+            if render_key == self._last_rendered_key and self._restore_cached_render():
+                return
 
-        self.current_word = full_data.get("word", "")
-
-        # Meanings от API (могут быть пустыми)
-        meanings = full_data.get("meanings", [])
-        merged_meanings = self._merge_meanings_by_pos(meanings)
-
-        # Lemminflect части (всегда пытаемся получить)
-        lemminflect_parts = self._get_lemminflect_parts(self.current_word)
-
-        # КРИТИЧНО: Если ни API, ни lemminflect не дали данных → no data
-        if not merged_meanings and not lemminflect_parts:
+        self.clear()
+        self._last_rendered_key = None
+        notebook = self._recycle_content()
+
+        try:
+            # КРИТИЧНО: Если full_data = None, показываем no data
+            if not full_data:
+                self._discard_notebook(notebook)
+                self._render_no_data()
+                self._load_image_for_word(self.current_word)
+                return
+
+            self.current_word = full_data.get("word", "")
+
+            # Meanings от API (могут быть пустыми)
+            meanings = full_data.get("meanings", [])
+            merged_meanings, api_grouped = self._merge_and_group(meanings)
+
+            # Lemminflect части (всегда пытаемся получить)
+            lemminflect_parts = self._get_lemminflect_parts(self.current_word)
+
+            # КРИТИЧНО: Если ни API, ни lemminflect не дали данных → no data
+            if not merged_meanings and not lemminflect_parts:
+                self._discard_notebook(notebook)
+                self._render_no_data()
+                self._load_image_for_word(self.current_word)
+                return
+
+            # Группируем meanings (один раз — результат используется и notebook'ом)
+            grouped = self._group_meanings(api_grouped, lemminflect_parts)
+
+            # Определяем первую активную вкладку
+            first_active_index = self._get_first_active_index(merged_meanings, grouped)
+            first_active_pos = self.POS_ORDER[first_active_index]
+
+            # Загружаем картинку для базовой формы первой активной вкладки
+            image_word = self._get_base_form_for_pos(self.current_word, first_active_pos)
+            self._load_image_for_word(image_word)
+
+            # Рендерим notebook (с данными от API и/или lemminflect)
+            self._render_notebook(grouped, first_active_index, content_width, notebook)
+
+            # Запоминаем рендер для повторного показа
+            self._last_rendered_key = render_key
+            self._last_image_word = image_word
+        except Exception:
+            # Переиспользованный notebook ещё хранит вкладки прошлого слова —
+            # под новым словом их показывать нельзя
+            self._discard_notebook(notebook)
+            self._discard_notebook(self._last_notebook)
+            self._last_notebook = None
             self._render_no_data()
-            self._load_image_for_word(self.current_word)
-            return
-
-        # Группируем meanings
-        grouped = self._group_meanings(merged_meanings, lemminflect_parts)
-
-        # Определяем первую активную вкладку
-        first_active_pos = self._get_first_active_pos(merged_meanings, grouped)
-
-        # Загружаем картинку для базовой формы первой активной вкладки
-        image_word = self._get_base_form_for_pos(self.current_word, first_active_pos)
-        self._load_image_for_word(image_word)
-
-        # Рендерим notebook (с данными от API и/или lemminflect)
-        self._render_notebook(merged_meanings, lemminflect_parts)
+            raise
+        finally:
+            # Показываем собранный контент одним pack() — один layout-проход вместо N
+            self._content.pack(fill="both", expand=True)
 
     def _get_lemminflect_parts(self, word: str) -> set[str]:
         """
@@ -592,95 +762,133 @@ class DictionaryRenderer:
 
         return supported_parts
 
-    def _merge_meanings_by_pos(self, meanings: List[Dict]) -> List[Dict]:
+    def _merge_and_group(self, meanings: List[Dict]) -> tuple[List[Dict], Dict[str, Optional[Dict]]]:
         """
-        Объединяет meanings с одинаковой частью речи.
+        Объединяет meanings с одинаковой частью речи и в том же проходе
+        раскладывает их по вкладкам.
 
         Логика:
         - Группирует по partOfSpeech
         - Сохраняет порядок первого появления части речи
         - Объединяет definitions[] (сквозная нумерация)
         - Объединяет synonyms[] и antonyms[] без дубликатов (case-insensitive)
-        - Скрывает блоки с пустыми definitions[]
+        - Скрывает блоки с пустыми definitions[] (позиция части речи и её
+          synonyms/antonyms учитываются с первого появления, даже если
+          definitions пришли в более позднем блоке)
 
         Args:
             meanings: Список meanings от API
 
         Returns:
-            Список объединённых meanings с уникальными partOfSpeech
+            (объединённые meanings, {pos вкладки: meaning или None}) —
+            оба общие для одинаковых входных данных, не изменять
+        """
+        # Замороженный ключ: partOfSpeech + (definition, example) + synonyms + antonyms
+        frozen = tuple(
+            (
+                meaning.get("partOfSpeech", "unknown"),
+                tuple(
+                    (d.get("definition", ""), d.get("example", ""))
+                    for d in meaning.get("definitions") or ()
+                ),
+                tuple(meaning.get("synonyms", ())),
+                tuple(meaning.get("antonyms", ()))
+            )
+            for meaning in meanings
+        )
+        return self._merge_frozen_meanings(frozen)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _merge_frozen_meanings(frozen: tuple) -> tuple[List[Dict], Dict[str, Optional[Dict]]]:
+        """
+        Кэшируемое ядро _merge_and_group.
+
+        Args:
+            frozen: Tuple (partOfSpeech, definitions, synonyms, antonyms) на каждый meaning
+
+        Returns:
+            (объединённые meanings, группировка API-данных по вкладкам)
         """
         merged = {}  # {partOfSpeech: {definitions: [], synonyms: [], antonyms: []}}
         order = []  # Сохраняем порядок первого появления
+        casefold = str.casefold  # Ключ дедупликации без учёта регистра
 
-        for meaning in meanings:
-            pos = meaning.get("partOfSpeech", "unknown")
-
-            if pos not in merged:
+        for pos, defs, synonyms, antonyms in frozen:
+            # Один поиск в dict на meaning, дальше работаем через локальную ссылку
+            bucket = merged.get(pos)
+            if bucket is None:
                 order.append(pos)
-                merged[pos] = {
+                bucket = {
                     "partOfSpeech": pos,
                     "definitions": [],
-                    "synonyms": [],
-                    "antonyms": []
+                    # Служебные dict'ы casefold → первое написание: порядок первого
+                    # появления сохраняется, дубликаты отсекает setdefault (C-уровень)
+                    "_syn": {},
+                    "_ant": {}
                 }
+                merged[pos] = bucket
 
             # Объединяем definitions (сохраняем порядок API)
-            merged[pos]["definitions"].extend(meaning.get("definitions", []))
+            if defs:
+                bucket["definitions"].extend(
+                    {"definition": definition, "example": example}
+                    for definition, example in defs
+                )
 
             # Объединяем synonyms (без дубликатов, case-insensitive)
-            existing_synonyms_lower = [s.lower() for s in merged[pos]["synonyms"]]
-            for syn in meaning.get("synonyms", []):
-                if syn.lower() not in existing_synonyms_lower:
-                    merged[pos]["synonyms"].append(syn)
-                    existing_synonyms_lower.append(syn.lower())
+            add_syn = bucket["_syn"].setdefault
+            for syn in synonyms:
+                add_syn(casefold(syn), syn)
 
             # Объединяем antonyms (без дубликатов, case-insensitive)
-            existing_antonyms_lower = [a.lower() for a in merged[pos]["antonyms"]]
-            for ant in meaning.get("antonyms", []):
-                if ant.lower() not in existing_antonyms_lower:
-                    merged[pos]["antonyms"].append(ant)
-                    existing_antonyms_lower.append(ant.lower())
+            add_ant = bucket["_ant"].setdefault
+            for ant in antonyms:
+                add_ant(casefold(ant), ant)
 
-        # Возвращаем в порядке первого появления, пропуская пустые definitions
+        # Возвращаем в порядке первого появления, пропуская пустые definitions,
+        # и сразу раскладываем по вкладкам
         result = []
+        grouped = dict.fromkeys(DictionaryRenderer.POS_ORDER)
+        other_meanings = []
         for pos in order:
-            if merged[pos]["definitions"]:  # Скрываем блоки с пустыми definitions
-                result.append(merged[pos])
+            bucket = merged[pos]
+            if not bucket["definitions"]:
+                continue  # Скрываем блоки с пустыми definitions
+            bucket["synonyms"] = list(bucket.pop("_syn").values())
+            bucket["antonyms"] = list(bucket.pop("_ant").values())
+            result.append(bucket)
+
+            tab = pos.lower()
+            if tab in DictionaryRenderer.MAJOR_POS:
+                grouped[tab] = bucket
+            else:
+                # ВСЁ ОСТАЛЬНОЕ (включая неизвестное) → OTHER
+                other_meanings.append(bucket)
 
-        return result
+        # Если есть "другие" части речи, создаём combined meaning
+        if other_meanings:
+            grouped["other"] = {
+                "partOfSpeech": "other",
+                "meanings": other_meanings
+            }
+
+        return result, grouped
 
-    def _group_meanings(self, merged_meanings: List[Dict], lemminflect_parts: set[str]) -> Dict[str, Optional[Dict]]:
+    def _group_meanings(self, api_grouped: Dict[str, Optional[Dict]], lemminflect_parts: set[str]) -> Dict[str, Optional[Dict]]:
         """
-        Группирует meanings по категориям вкладок.
+        Дополняет группировку API-данных вкладками от lemminflect.
 
         НОВОЕ: Учитывает части речи от lemminflect для включения пустых вкладок.
 
         Args:
-            merged_meanings: Meanings от API
+            api_grouped: Meanings от API, уже разложенные по вкладкам (_merge_and_group)
             lemminflect_parts: Части речи от lemminflect
 
         Returns:
             Dict с ключами из POS_ORDER, значения — meaning или placeholder или None
         """
-        grouped = {pos: None for pos in self.POS_ORDER}
-        other_meanings = []
-
-        # Группируем meanings от API
-        for meaning in merged_meanings:
-            pos = meaning.get("partOfSpeech", "").lower()
-
-            if pos in self.MAJOR_POS:
-                grouped[pos] = meaning
-            else:
-                # ВСЁ ОСТАЛЬНОЕ (включая неизвестное) → OTHER
-                other_meanings.append(meaning)
-
-        # Если есть "другие" части речи, создаём combined meaning
-        if other_meanings:
-            grouped["other"] = {
-                "partOfSpeech": "other",
-                "meanings": other_meanings
-            }
+        grouped = dict(api_grouped)  # api_grouped общий для кэша — не изменяем
 
         # НОВОЕ: Дополняем пустыми meanings для частей речи от lemminflect
         for pos in lemminflect_parts:
@@ -713,7 +921,7 @@ class DictionaryRenderer:
         if merged_meanings:
             first_pos = merged_meanings[0].get("partOfSpeech", "").lower()
             if first_pos in self.MAJOR_POS:
-                return self.POS_ORDER.index(first_pos)
+                return self.POS_INDEX[first_pos]
 
         # Приоритет 2: Первая активная вкладка в порядке NOUN → VERB → ADJ → ADV → OTHER
         for idx, pos in enumerate(self.POS_ORDER):
@@ -723,46 +931,95 @@ class DictionaryRenderer:
         # Fallback (не должно произойти)
         return 0
 
-    def _render_notebook(self, merged_meanings: List[Dict], lemminflect_parts: set[str]):
+    def _render_notebook(self, grouped: Dict[str, Optional[Dict]], first_active_index: int, width: int,
+                         notebook: Optional["CustomNotebook"] = None):
         """
         Создаёт кастомный Notebook с вкладками по частям речи.
 
         КРИТИЧНО: Всегда создаёт все 5 вкладок в фиксированном порядке.
+        Содержимое вкладки строится лениво — при первом её показе.
         НОВОЕ: Учитывает данные от lemminflect.
 
         Args:
-            merged_meanings: Список объединённых meanings
-            lemminflect_parts: Части речи от lemminflect
+            grouped: Meanings, сгруппированные по вкладкам (_group_meanings)
+            first_active_index: Индекс вкладки, показываемой первой
+            width: Ширина контента (один get_content_width() на render)
+            notebook: Notebook предыдущего рендера для повторного использования
         """
-        # Создаём кастомный notebook с callback для переключения
-        notebook = CustomNotebook(
-            self.parent,
-            pos_order=self.POS_ORDER,
-            on_tab_switch_callback=self._on_tab_switched
-        )
-        notebook.pack(fill="both", expand=True)
-
-        # Группируем meanings
-        grouped = self._group_meanings(merged_meanings, lemminflect_parts)
+        if notebook is not None:
+            # Tab bar и content area остаются, сбрасываются только вкладки
+            notebook.reset()
+        else:
+            # Создаём кастомный notebook с callback для переключения
+            notebook = CustomNotebook(
+                self._content,
+                pos_order=self.POS_ORDER,
+                on_tab_switch_callback=self._on_tab_switched
+            )
+            notebook.pack(fill="both", expand=True)
 
-        # Создаём все 5 вкладок
+        # Регистрируем все 5 вкладок; содержимое строится при первом показе
         for idx, pos in enumerate(self.POS_ORDER):
-            tab_frame = tk.Frame(notebook.content_area, bg=COLORS["bg"])
-
-            if grouped[pos] is not None:
-                # Активная вкладка с данными
-                self._create_active_tab_content(tab_frame, grouped[pos], pos)
-                notebook.add_tab(idx, tab_frame, disabled=False)
-            else:
-                # Disabled вкладка с placeholder
-                self._create_disabled_tab_content(tab_frame, pos)
-                notebook.add_tab(idx, tab_frame, disabled=True)
+            meaning = grouped[pos]
+            notebook.add_tab(
+                idx,
+                lambda idx=idx, meaning=meaning: self._build_tab(notebook.content_area, idx, meaning, width),
+                disabled=meaning is None
+            )
 
         # Показываем первую активную вкладку
-        first_active_index = self._get_first_active_index(merged_meanings, grouped)
         notebook.show_tab(first_active_index)
 
-    def _create_active_tab_content(self, tab_parent: tk.Frame, meaning: Dict, pos: str):
+        self._last_notebook = notebook
+        self._last_first_active = first_active_index
+
+    def _build_tab(self, parent: tk.Frame, idx: int, meaning: Optional[Dict], width: int) -> tk.Frame:
+        """
+        Строит Frame вкладки (вызывается CustomNotebook при первом показе).
+
+        Args:
+            parent: content_area notebook'а
+            idx: Индекс вкладки в POS_ORDER
+            meaning: Meaning вкладки или None для disabled
+            width: Ширина контента на момент render()
+
+        Returns:
+            Frame с содержимым вкладки
+        """
+        pos = self.POS_ORDER[idx]
+        tab_frame = tk.Frame(parent, bg=COLORS["bg"])
+
+        if meaning is not None:
+            # Активная вкладка с данными (построитель выбран заранее по части речи)
+            self._tab_builders[idx](tab_frame, meaning, pos, width)
+        else:
+            # Disabled вкладка с placeholder
+            self._create_disabled_tab_content(tab_frame, pos)
+
+        return tab_frame
+
+    def _create_major_tab_content(self, tab_parent: tk.Frame, meaning: Dict, pos: str, width: int):
+        """Вкладка основной части речи: контент — definitions"""
+        self._create_active_tab_content(
+            tab_parent, meaning, pos,
+            bool(meaning.get("definitions")),
+            self._render_scrollable_content,
+            width
+        )
+
+    def _create_other_tab_content(self, tab_parent: tk.Frame, meaning: Dict, pos: str, width: int):
+        """Вкладка OTHER: контент — sub-meanings с заголовками частей речи"""
+        self._create_active_tab_content(
+            tab_parent, meaning, pos,
+            bool(meaning.get("meanings")),
+            self._render_other_content,
+            width
+        )
+
+    def _create_active_tab_content(self, tab_parent: tk.Frame, meaning: Dict, pos: str,
+                                   has_content: bool,
+                                   render_body: Callable[[tk.Frame, Dict, int], None],
+                                   width: int):
         """
         Создаёт содержимое активной вкладки.
 
@@ -771,12 +1028,16 @@ class DictionaryRenderer:
         2. Разделитель "Meanings"
         3. Scrollable блок с определениями
 
-        КРИТИЧНО: Для OTHER проверяем наличие sub-meanings вместо definitions.
+        Проверка контента и рендерер тела задаются специализированными
+        построителями (_create_major_tab_content / _create_other_tab_content).
 
         Args:
             tab_parent: Frame вкладки
             meaning: Объединённый meaning блок
             pos: Часть речи (для форм)
+            has_content: Есть ли что показать в scrollable блоке
+            render_body: Рендерер scrollable блока
+            width: Ширина контента
         """
         is_lemminflect_only = meaning.get("lemminflect_only", False)
 
@@ -785,15 +1046,6 @@ class DictionaryRenderer:
         forms_frame.pack(fill="x", padx=10, pady=(10, 5))
         forms_labels = self._render_forms_block(forms_frame, pos, self.current_word)
 
-        # КРИТИЧНО: Для OTHER проверяем наличие sub-meanings
-        has_content = False
-        if pos == "other":
-            # Для OTHER проверяем meanings (sub-meanings)
-            has_content = bool(meaning.get("meanings"))
-        else:
-            # Для остальных проверяем definitions
-            has_content = bool(meaning.get("definitions"))
-
         # Если есть контент — показываем разделитель и scrollable content
         if not is_lemminflect_only and has_content:
             lbl_meanings_header = tk.Label(
@@ -815,26 +1067,21 @@ class DictionaryRenderer:
             scrollbar = CustomScrollbar(scroll_container, canvas)
             scrollable_frame = tk.Frame(canvas, bg=COLORS["bg"])
 
-            scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+            scrollable_frame.bind("<Configure>", self._on_scrollable_configure)
+            canvas.bind("<Configure>", self._invalidate_scroll_cache)
             canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
             canvas.configure(yscrollcommand=scrollbar.update)
             canvas.pack(side="left", fill="both", expand=True)
 
-            # Привязываем mousewheel к этому canvas
-            canvas.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
-            scrollable_frame.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
+            # Привязываем mousewheel к этому canvas (через тег, см. _on_scroll_tag_mousewheel)
+            tab_parent._dict_canvas = canvas
+            self._add_scroll_tag(canvas, scrollable_frame)
 
             # Рендерим определения
-            if pos == "other":
-                # Для OTHER рендерим все meanings с заголовками
-                self._render_other_content(scrollable_frame, canvas, meaning)
-            else:
-                # Для обычных частей речи рендерим как обычно
-                self._render_scrollable_content(scrollable_frame, canvas, meaning)
+            render_body(scrollable_frame, meaning, width)
 
             # Привязываем mousewheel к forms labels
-            for lbl in forms_labels:
-                lbl.bind("<MouseWheel>", lambda e, c=canvas: self._on_tab_mousewheel(e, c))
+            self._add_scroll_tag(*forms_labels)
         else:
             # Только формы, без определений
             # Показываем placeholder текст
@@ -865,7 +1112,7 @@ class DictionaryRenderer:
         )
         lbl.pack(expand=True)
 
-    def _render_forms_block(self, parent: tk.Frame, pos: str, word: str) -> list[tk.Label]:
+    def _render_forms_block(self, parent: tk.Frame, pos: str, word: str) -> list[tk.Widget]:
         """
         Рендерит блок словоформ БЕЗ заголовка "Forms".
 
@@ -874,9 +1121,10 @@ class DictionaryRenderer:
         Past:                 backed
         Gerund:               backing
 
-        - Метки серым (width=22), слова обычным шрифтом
+        - Метки серым, слова обычным шрифтом (колонка выровнена tab-стопом)
         - Исходное слово выделяем желтым
         - Если форм нет → пустой блок
+        - Весь блок — один tk.Text с тегами вместо двух Label на каждую форму
 
         Args:
             parent: Родительский Frame
@@ -884,9 +1132,8 @@ class DictionaryRenderer:
             word: Исходное слово
 
         Returns:
-            Список созданных Label для биндинга mousewheel
+            Список созданных виджетов для биндинга mousewheel
         """
-        created_labels = []
         original_word_lower = word.lower()
 
         # Получаем формы
@@ -894,75 +1141,88 @@ class DictionaryRenderer:
 
         # Если форм нет → возвращаем пустой список
         if not forms:
-            return created_labels
+            return []
+
+        # Колонка слов на ширине 17 символов — как бывший Label метки с width=17.
+        # Ширина Text в символах по самой длинной строке: в OTHER блок лежит в
+        # scrollable_frame внутри canvas, который не растянут по ширине
+        measure = self._def_font.measure
+        tab_px = measure("0" * 17)
+        line_px = 0
+        for label_text, form_word in forms:
+            # Метка длиннее колонки уходит на следующий tab-стоп (шаг tab_px)
+            column_px = (measure(f"{label_text}:") // tab_px + 1) * tab_px
+            line_px = max(line_px, column_px + measure(form_word))
+
+        text = tk.Text(
+            parent,
+            height=len(forms),
+            width=line_px // measure("0") + 1,
+            wrap="none",
+            font=FONTS["definition"],
+            bg=COLORS["bg"],
+            fg=COLORS["text_main"],
+            bd=0,
+            highlightthickness=0,
+            padx=0,
+            pady=0,
+            cursor="arrow",
+            takefocus=0,
+            exportselection=False,
+            tabs=(tab_px,)
+        )
+        text.pack(fill="x", anchor="w")
+
+        text.tag_configure("label", foreground=COLORS["text_faint"])
+        text.tag_configure("original", foreground=COLORS["text_accent"])
 
         # Рендерим все формы
-        for form_str in forms:
-            parts = form_str.split(": ", 1)
-
-            if len(parts) == 2:
-                label_text, form_word = parts
-
-                # Проверяем совпадение с исходным словом
-                is_original = form_word.lower().strip() == original_word_lower
-                form_color = COLORS["text_accent"] if is_original else COLORS["text_main"]
-
-                row = tk.Frame(parent, bg=COLORS["bg"])
-                row.pack(anchor="w", pady=0)
-
-                # Метка формы (серым, width=22 для выравнивания)
-                lbl_label = tk.Label(
-                    row,
-                    text=f"{label_text}:",
-                    font=FONTS["definition"],
-                    bg=COLORS["bg"],
-                    fg=COLORS["text_faint"],
-                    anchor="w",
-                    width=17
-                )
-                lbl_label.pack(side="left")
-                created_labels.append(lbl_label)
-
-                # Само слово (обычным шрифтом, желтое если исходное)
-                lbl_form = tk.Label(
-                    row,
-                    text=form_word,
-                    font=FONTS["definition"],
-                    bg=COLORS["bg"],
-                    fg=form_color,
-                    anchor="w"
-                )
-                lbl_form.pack(side="left")
-                created_labels.append(lbl_form)
+        for line_idx, (label_text, form_word) in enumerate(forms):
+            if line_idx:
+                text.insert("end", "\n")
+
+            # Метка формы (серым), затем само слово (желтое если исходное)
+            is_original = form_word.lower().strip() == original_word_lower
+            text.insert("end", f"{label_text}:\t", "label")
+            text.insert("end", form_word, "original" if is_original else ())
 
-        return created_labels
+        text.config(state="disabled")
+        self._strip_text_bindings(text)
+        return [text]
 
-    def _render_scrollable_content(self, scrollable_frame: tk.Frame, canvas: tk.Canvas, meaning: Dict):
+    def _render_scrollable_content(self, scrollable_frame: tk.Frame, meaning: Dict, width: int):
         """
         Рендерит определения, синонимы, антонимы в scrollable frame.
 
         Args:
             scrollable_frame: Frame для рендеринга
-            canvas: Canvas для mousewheel
             meaning: Объединённый meaning блок
+            width: Ширина контента
         """
         definitions = meaning.get("definitions", [])
         synonyms = meaning.get("synonyms", [])
         antonyms = meaning.get("antonyms", [])
 
-        # Рендерим все определения
-        for idx, definition in enumerate(definitions, start=1):
-            self._render_definition(scrollable_frame, canvas, definition, idx)
+        # Рендерим все определения в один grid-контейнер (без Frame на каждое определение)
+        if definitions:
+            defs_frame = tk.Frame(scrollable_frame, bg=COLORS["bg"])
+            defs_frame.pack(fill="x", padx=0, pady=0)
+            defs_frame.grid_columnconfigure(1, weight=1)
+            self._add_scroll_tag(defs_frame)
+
+            row = 0
+            for idx, definition in enumerate(definitions, start=1):
+                row = self._render_definition(defs_frame, definition, idx, row, width)
 
         # Рендерим синонимы (если есть)
         if synonyms:
-            self._render_synonyms(scrollable_frame, canvas, synonyms)
+            self._render_word_list(scrollable_frame, "Synonyms", synonyms, width)
 
         # Рендерим антонимы (если есть)
         if antonyms:
-            self._render_antonyms(scrollable_frame, canvas, antonyms)
+            self._render_word_list(scrollable_frame, "Antonyms", antonyms, width)
 
-    def _render_other_content(self, scrollable_frame: tk.Frame, canvas: tk.Canvas, other_meaning: Dict):
+    def _render_other_content(self, scrollable_frame: tk.Frame, other_meaning: Dict, width: int):
         """
         Рендерит содержимое вкладки OTHER с заголовками для каждой части речи.
 
@@ -970,11 +1230,17 @@ class DictionaryRenderer:
 
         Args:
             scrollable_frame: Frame для рендеринга
-            canvas: Canvas для mousewheel
             other_meaning: Dict с ключом "meanings" содержащим список meanings
+            width: Ширина контента
         """
         meanings_list = other_meaning.get("meanings", [])
 
+        # Цвета и шрифт в локальные переменные: один lookup на вызов, а не на часть речи
+        bg = COLORS["bg"]
+        text_accent = COLORS["text_accent"]
+        separator = COLORS["separator"]
+        font_pos = FONTS["pos"]
+
         for meaning in meanings_list:
             pos = meaning.get("partOfSpeech", "unknown")
 
@@ -982,345 +1248,437 @@ class DictionaryRenderer:
             lbl_pos = tk.Label(
                 scrollable_frame,
                 text=pos.upper(),
-                font=FONTS["pos"],
-                bg=COLORS["bg"],
-                fg=COLORS["text_accent"]
+                font=font_pos,
+                bg=bg,
+                fg=text_accent
             )
             lbl_pos.pack(anchor="w", padx=10, pady=(10, 5))
-            lbl_pos.bind("<MouseWheel>", lambda e, c=canvas: self._on_tab_mousewheel(e, c))
+            self._add_scroll_tag(lbl_pos)
 
             # НОВОЕ: Блок словоформ (если есть поддержка lemminflect)
             upos = get_upos(pos)
             if upos:  # Есть поддержка форм
-                forms_frame = tk.Frame(scrollable_frame, bg=COLORS["bg"])
+                forms_frame = tk.Frame(scrollable_frame, bg=bg)
                 forms_frame.pack(fill="x", padx=10, pady=(0, 5))
                 forms_labels = self._render_forms_block(forms_frame, pos, self.current_word)
 
                 # Привязываем mousewheel
-                for lbl in forms_labels:
-                    lbl.bind("<MouseWheel>", lambda e, c=canvas: self._on_tab_mousewheel(e, c))
+                self._add_scroll_tag(*forms_labels)
 
                 # Разделитель после Forms
-                tk.Frame(scrollable_frame, height=1, bg=COLORS["separator"]).pack(
+                tk.Frame(scrollable_frame, height=1, bg=separator).pack(
                     fill="x", padx=10, pady=0
                 )
 
             # Рендерим определения этой части речи
-            self._render_scrollable_content(scrollable_frame, canvas, meaning)
+            self._render_scrollable_content(scrollable_frame, meaning, width)
 
-    def _render_definition(self, parent: tk.Frame, canvas: tk.Canvas, definition: Dict, index: int):
+    def _render_definition(self, parent: tk.Frame, definition: Dict, index: int, row: int, width: int) -> int:
         """
-        Рендерит одно определение с примером.
+        Рендерит одно определение с примером в grid-контейнер определений.
+
+        Номер — в колонке 0, текст определения и пример — в колонке 1
+        (пример выравнивается под текстом без отдельного Frame и Label-отступа).
 
         Args:
-            parent: Frame для рендеринга
-            canvas: Canvas для mousewheel
+            parent: Grid-контейнер определений
             definition: Блок определения от API
             index: Номер определения (сквозная нумерация)
+            row: Первая свободная строка grid
+            width: Ширина контента
+
+        Returns:
+            Следующая свободная строка grid
         """
         def_text = definition.get("definition", "")
         example = definition.get("example", "")
 
         if not def_text:
-            return
-
-        # Фрейм для определения
-        def_frame = tk.Frame(parent, bg=COLORS["bg"])
-        def_frame.pack(fill="x", padx=0, pady=0)
+            return row
 
-        # Привязываем mousewheel к Frame определения
-        def_frame.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
+        bg = COLORS["bg"]
+        text_accent = COLORS["text_accent"]
+        text_main = COLORS["text_main"]
+        text_faint = COLORS["text_faint"]
+        font_def = FONTS["definition"]
+        wrap_width = width - 40
 
         # Номер определения
         lbl_num = tk.Label(
-            def_frame,
+            parent,
             text=f"{index}",
-            font=FONTS["definition"],
-            bg=COLORS["bg"],
-            fg=COLORS["text_accent"]
+            font=font_def,
+            bg=bg,
+            fg=text_accent
         )
-        lbl_num.pack(side="left", anchor="nw", padx=(0, 5))
-
-        # Привязываем mousewheel к номеру определения
-        lbl_num.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
+        lbl_num.grid(row=row, column=0, sticky="nw", padx=(0, 5))
 
         # Текст определения
         lbl_def = tk.Label(
-            def_frame,
+            parent,
             text=def_text,
-            font=FONTS["definition"],
-            bg=COLORS["bg"],
-            fg=COLORS["text_main"],
-            wraplength=self.get_content_width() - 40,
+            font=font_def,
+            bg=bg,
+            fg=text_main,
+            wraplength=wrap_width,
             justify="left",
             anchor="w"
         )
-        lbl_def.pack(side="left", fill="x", expand=True, anchor="nw")
+        lbl_def.grid(row=row, column=1, sticky="ew")
 
-        # Привязываем mousewheel к Label определения
-        lbl_def.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
+        # Привязываем mousewheel к номеру и Label определения
+        self._add_scroll_tag(lbl_num, lbl_def)
 
         # Обработчик клика для озвучивания определения
         lbl_def.bind("<Button-1>", lambda e: self._on_definition_click(def_text))
 
         # Привязываем hover-перевод к Label определения
-        self.bind_hover_translation(lbl_def, def_text)
+        self._bind_hover(lbl_def, def_text)
+
+        row += 1
 
         # Пример (с hover-переводом и озвучиванием)
         if example:
-            # Фрейм для примера
-            example_frame = tk.Frame(parent, bg=COLORS["bg"])
-            example_frame.pack(fill="x", padx=0, pady=(0, 0))
-
-            # Привязываем mousewheel к Frame примера
-            example_frame.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
-
-            # Пустой Label для отступа
-            lbl_example_indent = tk.Label(
-                example_frame,
-                text="",
-                font=FONTS["definition"],
-                bg=COLORS["bg"],
-                width=len(f"{index}.")
-            )
-            lbl_example_indent.pack(side="left", anchor="nw", padx=(0, 5))
-
-            # Привязываем mousewheel к отступу примера
-            lbl_example_indent.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
-
             # Текст примера (курсивом)
             lbl_example = tk.Label(
-                example_frame,
+                parent,
                 text=example,
-                font=(FONTS["definition"][0], FONTS["definition"][1], "italic"),
-                bg=COLORS["bg"],
-                fg=COLORS["text_faint"],
-                wraplength=self.get_content_width() - 40,
+                font=FONTS["definition_italic"],
+                bg=bg,
+                fg=text_faint,
+                wraplength=wrap_width,
                 justify="left",
                 anchor="w"
             )
-            lbl_example.pack(side="left", fill="x", expand=True, anchor="nw")
+            lbl_example.grid(row=row, column=1, sticky="ew")
 
             # Обработчик клика для озвучивания примера
             lbl_example.bind("<Button-1>", lambda e: self._on_definition_click(example))
 
             # Привязываем hover-перевод для примера
-            self.bind_hover_translation(lbl_example, example)
+            self._bind_hover(lbl_example, example)
 
             # Привязываем mousewheel к Label примера
-            lbl_example.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
+            self._add_scroll_tag(lbl_example)
+
+            row += 1
 
-    def _render_synonyms(self, parent: tk.Frame, canvas: tk.Canvas, synonyms: List[str]):
+        return row
+
+    def _render_word_list(self, parent: tk.Frame, title: str, words: List[str], width: int):
         """
-        Рендерит список синонимов (объединённых из всех блоков) с переносом на новые строки.
+        Рендерит список синонимов/антонимов одним tk.Text с тегами.
+
+        Вместо Label на каждое слово — один виджет: слова помечены тегом "word",
+        клик и hover привязаны через tag_bind один раз на блок.
+        Перенос строк считается заранее через Font.measure (без geometry-прохода),
+        поэтому высота Text известна сразу.
 
         Args:
             parent: Frame для рендеринга
-            canvas: Canvas для mousewheel
-            synonyms: Список синонимов без дубликатов
+            title: Заголовок блока ("Synonyms" / "Antonyms")
+            words: Список слов без дубликатов
+            width: Ширина контента
         """
-        if not synonyms:
+        if not words:
             return
 
-        # Основной контейнер
-        syn_frame = tk.Frame(parent, bg=COLORS["bg"])
-        syn_frame.pack(fill="x", padx=0, pady=(5, 0))
-
-        # Привязываем mousewheel к Frame синонимов
-        syn_frame.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
-
-        # Заголовок в первой строке, первой колонке
-        lbl_syn_title = tk.Label(
-            syn_frame,
-            text="Synonyms:",
-            font=FONTS["definition"],
-            bg=COLORS["bg"],
-            fg=COLORS["text_faint"]
-        )
-        lbl_syn_title.grid(row=0, column=0, sticky="w", padx=(0, 5))
-
-        # Привязываем mousewheel к заголовку
-        lbl_syn_title.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
+        title_text = f"{title}:  "
+        available_width = width - 100
 
-        # Создаём синонимы в grid для переноса
-        available_width = self.get_content_width() - 100
+        # Раскладываем слова по строкам
+        rows = [[]]
         current_width = 0
-        row = 0
-        col = 1
-
-        # Временный Label для измерения ширины
-        temp_label = tk.Label(syn_frame, font=FONTS["definition"])
-
-        for idx, syn in enumerate(synonyms[:20]):
-            # Измеряем ширину синонима
-            temp_label.config(text=syn)
-            temp_label.update_idletasks()
-            word_width = temp_label.winfo_reqwidth() + 20
+        for word in words[:20]:
+            word_width = self._def_font.measure(word) + 20
 
             # Проверяем перенос
-            if current_width + word_width > available_width and col > 1:
-                row += 1
-                col = 1
+            if current_width + word_width > available_width and rows[-1]:
+                rows.append([])
                 current_width = 0
 
-            # Создаём Label для синонима
-            lbl_syn = tk.Label(
-                syn_frame,
-                text=syn,
-                font=FONTS["definition"],
-                bg=COLORS["bg"],
-                fg=COLORS["text_accent"],
-                cursor="hand2",
-                padx=5
-            )
-            lbl_syn.grid(row=row, column=col, sticky="w")
+            rows[-1].append(word)
+            current_width += word_width
 
-            # Привязываем события
-            lbl_syn.bind("<Button-1>", lambda e, word=syn: self.on_synonym_click(word))
-            lbl_syn.bind("<Enter>", lambda e, word=syn, btn=lbl_syn: self._on_synonym_hover_enter(e, word, btn))
-            lbl_syn.bind("<Leave>", lambda e, btn=lbl_syn: self._on_synonym_hover_leave(e, btn))
-            lbl_syn.bind("<MouseWheel>", lambda e, c=canvas: self._on_tab_mousewheel(e, c))
+        # Ширина в символах по самой длинной строке: scrollable_frame в canvas не
+        # растянут по ширине, поэтому Text сам запрашивает место под строки
+        measure = self._def_font.measure
+        row_px = measure(title_text) + max(measure("  ".join(row)) for row in rows)
+        text_width = row_px // measure("0") + 1
+
+        text = tk.Text(
+            parent,
+            height=len(rows),
+            width=text_width,
+            wrap="none",
+            font=FONTS["definition"],
+            bg=COLORS["bg"],
+            fg=COLORS["text_accent"],
+            bd=0,
+            highlightthickness=0,
+            padx=0,
+            pady=0,
+            cursor="arrow",
+            takefocus=0,
+            exportselection=False
+        )
+        text.pack(fill="x", padx=0, pady=(5, 0))
+
+        # Заголовок серым, строки-продолжения выровнены под первым словом
+        text.tag_configure("title", foreground=COLORS["text_faint"])
+        text.tag_configure("cont", lmargin1=self._def_font.measure(title_text))
+        text.tag_configure("hover", background=self._WORD_HOVER_BG, foreground=self._WORD_HOVER_FG)
+
+        text.insert("end", title_text, "title")
+        for row_idx, row in enumerate(rows):
+            line_tags = ("cont",) if row_idx else ()
+            if row_idx:
+                text.insert("end", "\n")
+            for word_idx, word in enumerate(row):
+                if word_idx:
+                    text.insert("end", "  ", line_tags)
+                text.insert("end", word, ("word",) + line_tags)
+
+        # Привязываем события (один раз на блок, не на каждое слово)
+        text.tag_bind("word", "<Button-1>", self._on_word_click)
+        text.tag_bind("word", "<Enter>", self._on_word_enter)
+        text.tag_bind("word", "<Leave>", self._on_word_leave)
+
+        text.config(state="disabled")
+        self._strip_text_bindings(text)
+        self._add_scroll_tag(text)
 
-            current_width += word_width
-            col += 1
+    def _render_no_data(self):
+        """Рендерит placeholder при отсутствии данных"""
+        lbl = tk.Label(
+            self._content,
+            text="No dictionary data",
+            font=FONTS["definition"],
+            bg=COLORS["bg"],
+            fg=COLORS["text_faint"]
+        )
+        lbl.pack(pady=20)
 
-        temp_label.destroy()
+    @staticmethod
+    def _word_range(text: tk.Text) -> tuple:
+        """Диапазон (start, end) слова под курсором мыши или пустой tuple"""
+        return text.tag_prevrange("word", "current + 1c")
 
-    def _render_antonyms(self, parent: tk.Frame, canvas: tk.Canvas, antonyms: List[str]):
+    def _on_word_click(self, event):
         """
-        Рендерит список антонимов (объединённых из всех блоков) с переносом на новые строки.
+        Клик по синониму/антониму — поиск этого слова.
 
         Args:
-            parent: Frame для рендеринга
-            canvas: Canvas для mousewheel
-            antonyms: Список антонимов без дубликатов
+            event: Событие Button-1 на теге "word"
+        """
+        word_range = self._word_range(event.widget)
+        if word_range:
+            self.on_synonym_click(event.widget.get(*word_range))
+
+    def _on_word_enter(self, event):
+        """
+        Обработка наведения на синоним/антоним - желтый фон, черный текст.
+
+        Подсветка не применяется сразу, а запоминается и выставляется в
+        after_idle (см. _schedule_word_hover): при проведении курсора по
+        строке пары Leave/Enter за один проход цикла схлопываются.
+
+        Args:
+            event: Событие Enter на теге "word"
         """
-        if not antonyms:
+        text = event.widget
+        word_range = self._word_range(text)
+        if not word_range:
             return
 
-        # Основной контейнер
-        ant_frame = tk.Frame(parent, bg=COLORS["bg"])
-        ant_frame.pack(fill="x", padx=0, pady=(5, 0))
+        # Подсвечиваем только слово под курсором
+        self._schedule_word_hover(text, word_range)
 
-        # Привязываем mousewheel к Frame антонимов
-        ant_frame.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
+        # Вызываем оригинальный hover callback (если нужен)
+        self.on_synonym_enter(event, text.get(*word_range), text)
 
-        # Заголовок в первой строке, первой колонке
-        lbl_ant_title = tk.Label(
-            ant_frame,
-            text="Antonyms:",
-            font=FONTS["definition"],
-            bg=COLORS["bg"],
-            fg=COLORS["text_faint"]
-        )
-        lbl_ant_title.grid(row=0, column=0, sticky="w", padx=(0, 5))
+    def _on_word_leave(self, event):
+        """
+        Обработка ухода курсора с синонима/антонима - возврат к исходным цветам.
 
-        # Привязываем mousewheel к заголовку
-        lbl_ant_title.bind("<MouseWheel>", lambda e: self._on_tab_mousewheel(e, canvas))
+        Args:
+            event: Событие Leave на теге "word"
+        """
+        self._schedule_word_hover(event.widget, None)
 
-        # Создаём антонимы в grid для переноса
-        available_width = self.get_content_width() - 100
-        current_width = 0
-        row = 0
-        col = 1
+    def _schedule_word_hover(self, text: tk.Text, word_range: Optional[tuple]):
+        """Запоминает целевую подсветку блока и планирует одно применение на проход цикла"""
+        text._hover_target = word_range
+        if getattr(text, "_hover_pending", False):
+            return
+        text._hover_pending = True
+        text.after_idle(self._apply_word_hover, text)
+
+    @staticmethod
+    def _apply_word_hover(text: tk.Text):
+        """Применяет последнюю запомненную подсветку (Text мог быть уничтожен за это время)"""
+        text._hover_pending = False
+        if not text.winfo_exists():
+            return
 
-        # Временный Label для измерения ширины
-        temp_label = tk.Label(ant_frame, font=FONTS["definition"])
+        # Подсветка уже такая — повторный Enter на том же слове ничего не перекрашивает
+        word_range = text._hover_target
+        applied = getattr(text, "_hover_applied", None)
+        if word_range == applied:
+            return
+        text._hover_applied = word_range
 
-        for idx, ant in enumerate(antonyms[:20]):
-            # Измеряем ширину антонима
-            temp_label.config(text=ant)
-            temp_label.update_idletasks()
-            word_width = temp_label.winfo_reqwidth() + 20
+        if applied:
+            text.tag_remove("hover", *applied)
+        if word_range:
+            text.tag_add("hover", *word_range)
+        # Курсор меняется только при входе в слова блока / выходе из них
+        if not word_range or not applied:
+            text.config(cursor="hand2" if word_range else "arrow")
 
-            # Проверяем перенос
-            if current_width + word_width > available_width and col > 1:
-                row += 1
-                col = 1
-                current_width = 0
+    def _bind_hover(self, widget: tk.Widget, text: str):
+        """
+        Подключает hover-перевод к виджету через общий bindtag.
 
-            # Создаём Label для антонима
-            lbl_ant = tk.Label(
-                ant_frame,
-                text=ant,
-                font=FONTS["definition"],
-                bg=COLORS["bg"],
-                fg=COLORS["text_accent"],
-                cursor="hand2",
-                padx=5
-            )
-            lbl_ant.grid(row=row, column=col, sticky="w")
+        Текст хранится на самом виджете; Enter/Leave привязаны один раз
+        на класс _HOVER_TAG, поэтому рендер не создаёт Tcl-команд на Label.
+        """
+        widget._hover_text = text
+        widget.bindtags((self._HOVER_TAG,) + widget.bindtags())
 
-            # Привязываем события
-            lbl_ant.bind("<Button-1>", lambda e, word=ant: self.on_synonym_click(word))
-            lbl_ant.bind("<Enter>", lambda e, word=ant, btn=lbl_ant: self._on_synonym_hover_enter(e, word, btn))
-            lbl_ant.bind("<Leave>", lambda e, btn=lbl_ant: self._on_synonym_hover_leave(e, btn))
-            lbl_ant.bind("<MouseWheel>", lambda e, c=canvas: self._on_tab_mousewheel(e, c))
+    def _on_hover_tag_enter(self, event):
+        """Enter на определении/примере: запускает hover-перевод его текста"""
+        widget = event.widget
+        self.on_synonym_enter(event, widget._hover_text, widget)
 
-            current_width += word_width
-            col += 1
+    def _on_hover_tag_leave(self, event):
+        """Leave с определения/примера: скрывает перевод"""
+        self.on_synonym_leave(event, event.widget)
 
-        temp_label.destroy()
+    def _on_scrollable_configure(self, event):
+        """
+        <Configure> scrollable frame: пересчёт scrollregion откладывается в after_idle.
 
-    def _render_no_data(self):
-        """Рендерит placeholder при отсутствии данных"""
-        lbl = tk.Label(
-            self.parent,
-            text="No dictionary data",
-            font=FONTS["definition"],
-            bg=COLORS["bg"],
-            fg=COLORS["text_faint"]
-        )
-        lbl.pack(pady=20)
+        Серия Configure-событий за один проход цикла даёт один bbox("all").
+        """
+        canvas = event.widget.master  # scrollable_frame создан внутри canvas
+        if getattr(canvas, "_scrollregion_pending", False):
+            return
+        canvas._scrollregion_pending = True
+        canvas.after_idle(self._update_scrollregion, canvas)
+
+    @staticmethod
+    def _update_scrollregion(canvas: tk.Canvas):
+        """Применяет отложенный scrollregion (canvas мог быть уничтожен за это время)"""
+        canvas._scrollregion_pending = False
+        canvas._scroll_needed = None
+        if canvas.winfo_exists():
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+    @staticmethod
+    def _invalidate_scroll_cache(event):
+        """<Configure> canvas: размер окна изменился — решение о прокрутке неизвестно"""
+        event.widget._scroll_needed = None
+
+    @staticmethod
+    def _strip_text_bindings(text: tk.Text):
+        """
+        Убирает class-биндинги Text: блок ведёт себя как набор Label.
 
-    def _on_synonym_hover_enter(self, event, word: str, label: tk.Label):
+        Без тега "Text" нет выделения мышью, фокуса и собственной прокрутки
+        колесом; tag_bind и метка "current" работают внутри виджета и не
+        зависят от bindtags.
         """
-        Обработка наведения на синоним/антоним - желтый фон, черный текст.
+        text.bindtags(tuple(tag for tag in text.bindtags() if tag != "Text"))
 
-        Args:
-            event: Событие Enter
-            word: Слово для перевода
-            label: Label виджет
+    def _add_scroll_tag(self, *widgets: tk.Widget):
         """
-        # Меняем цвет на желтый фон + черный текст
-        label.config(bg="#FFD700", fg="#000000")
+        Подключает виджеты к общему mousewheel-биндингу словаря.
 
-        # Вызываем оригинальный hover callback (если нужен)
-        self.on_synonym_enter(event, word, label)
+        Тег ставится ПЕРВЫМ в bindtags, чтобы "break" из обработчика
+        останавливал class/toplevel биндинги так же, как при widget.bind().
+        """
+        tag = (self._SCROLL_TAG,)
+        for widget in widgets:
+            widget.bindtags(tag + widget.bindtags())
 
-    def _on_synonym_hover_leave(self, event, label: tk.Label):
+    def _on_scroll_tag_mousewheel(self, event):
         """
-        Обработка ухода курсора с синонима/антонима - возврат к исходным цветам.
+        Class-обработчик mousewheel: находит canvas вкладки по цепочке master.
 
-        Args:
-            event: Событие Leave
-            label: Label виджет
+        Canvas сохраняется во Frame вкладки атрибутом _dict_canvas,
+        все прокручиваемые виджеты вкладки — его потомки.
         """
-        # Возвращаем исходные цвета
-        label.config(bg=COLORS["bg"], fg=COLORS["text_accent"])
+        widget = event.widget
+        while widget is not None:
+            canvas = getattr(widget, "_dict_canvas", None)
+            if canvas is not None:
+                return self._on_tab_mousewheel(event, canvas)
+            widget = getattr(widget, "master", None)
+        return None
 
     def _on_tab_mousewheel(self, event, canvas: tk.Canvas):
         """
         Обработчик mousewheel для Canvas внутри вкладки.
 
-        Перенаправляет событие на соответствующий canvas для корректной прокрутки.
-        КРИТИЧНО: Проверяет необходимость прокрутки перед выполнением.
+        Шаги колеса копятся в canvas._wheel_accum, прокрутка выполняется
+        одним yview_scroll в after_idle — серия событий за проход цикла
+        даёт одну перерисовку.
 
         Args:
             event: MouseWheel событие
             canvas: Canvas вкладки
         """
-        # Получаем границы видимой области
+        # Известно, что контент виден целиком: ни накопления, ни after_idle
+        if getattr(canvas, "_scroll_needed", None) is False:
+            return "break"
+
+        # Целочисленный шаг с округлением к нулю как int(-delta / 120);
+        # типичные ±120 (один щелчок колеса) — без деления
+        delta = event.delta
+        if delta == 120:
+            step = -1
+        elif delta == -120:
+            step = 1
+        else:
+            step = -(delta // 120) if delta > 0 else -delta // 120
+        if step:
+            canvas._wheel_accum = getattr(canvas, "_wheel_accum", 0) + step
+            if not getattr(canvas, "_wheel_pending", False):
+                canvas._wheel_pending = True
+                canvas.after_idle(self._flush_wheel, canvas)
+        return "break"  # Останавливаем всплытие события
+
+    @staticmethod
+    def _flush_wheel(canvas: tk.Canvas):
+        """
+        Применяет накопленную прокрутку одним вызовом.
+
+        КРИТИЧНО: Проверяет необходимость прокрутки. Решение "контент виден
+        целиком" кэшируется в canvas._scroll_needed и сбрасывается на
+        <Configure> canvas и scrollable frame. Шаги в сторону края, в который
+        вид уже упёрся, отбрасываются без вызова yview_scroll.
+        """
+        accum = canvas._wheel_accum
+        canvas._wheel_accum = 0
+        canvas._wheel_pending = False
+        if not accum or not canvas.winfo_exists():
+            return
+
+        needed = getattr(canvas, "_scroll_needed", None)
+        if needed is False:
+            return
+
         view = canvas.yview()
+        if needed is None:
+            # Если весь контент виден (view[0] == 0.0 и view[1] >= 1.0), прокрутка не нужна
+            canvas._scroll_needed = not (view[0] <= 0.0 and view[1] >= 1.0)
 
-        # Проверяем нужна ли прокрутка
-        # Если весь контент виден (view[0] == 0.0 и view[1] >= 1.0), игнорируем событие
-        if view[0] <= 0.0 and view[1] >= 1.0:
-            return "break"  # Контент полностью виден, прокрутка не нужна
+        # Вид уже у края в направлении прокрутки — накопленное просто сбрасывается
+        if (accum > 0 and view[1] >= 1.0) or (accum < 0 and view[0] <= 0.0):
+            return
 
-        # Выполняем прокрутку
-        canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        return "break"  # Останавливаем всплытие события
+        canvas.yview_scroll(accum, "units")
 
     def _on_definition_click(self, text: str):
         """
@@ -1329,7 +1687,8 @@ class DictionaryRenderer:
         Озвучивает текст через Google Official TTS API с fallback на unofficial TTS.
         Использует временные файлы (use_cache=False) в TEMP_AUDIO_DIR.
 
-        Защита от наложения: если уже воспроизводится аудио, клик игнорируется.
+        Защита от наложения: если аудио уже воспроизводится или в очереди,
+        клик игнорируется.
 
         Args:
             text: Английское предложение для озвучивания
@@ -1338,11 +1697,19 @@ class DictionaryRenderer:
         if self._audio_playing:
             return
 
-        def worker():
+        try:
+            self._audio_queue.put_nowait(text)
+        except queue.Full:
+            pass  # Уже есть ожидающий запрос - быстрые повторные клики отбрасываем
+
+    def _audio_loop(self):
+        """Постоянный worker-поток: озвучивает тексты из очереди по одному"""
+        from network import ensure_audio_ready, play_audio_safe
+
+        while True:
+            text = self._audio_queue.get()
             self._audio_playing = True
             try:
-                from network import ensure_audio_ready, play_audio_safe
-
                 # Получаем аудио (временный кэш в TEMP_AUDIO_DIR)
                 audio_path = ensure_audio_ready(text, use_cache=False)
 
@@ -1353,6 +1720,3 @@ class DictionaryRenderer:
                 pass
             finally:
                 self._audio_playing = False
-
-        # Запускаем в отдельном потоке (не блокируем GUI)
-        threading.Thread(target=worker, daemon=True).start()
@@ -108,7 +108,6 @@ class MainWindow(tk.Tk):
         self.dict_renderer = DictionaryRenderer(
             self.scrollable_frame,
             lambda: self.content_width,
-            self._bind_hover_translation,
             self.on_synonym_click,
             self._on_synonym_enter,
             self._on_synonym_leave,
@@ -452,11 +451,6 @@ class MainWindow(tk.Tk):
 
     # ===== TOOLTIP LOGIC =====
 
-    def _bind_hover_translation(self, widget: tk.Widget, text: str):
-        """Универсальный биндинг hover-перевода для любого виджета"""
-        widget.bind("<Enter>", lambda e: self._on_text_enter(e, text))
-        widget.bind("<Leave>", self._on_text_leave)
-
     def _on_text_enter(self, event, text: str):
         """Обработка наведения на текст"""
         if text in self.trans_cache:
@@ -503,15 +497,13 @@ class MainWindow(tk.Tk):
         if self.search_callback:
             self.search_callback(word)
 
-    def _on_synonym_enter(self, event, text: str, widget: tk.Label):
-        """Hover эффект для синонима"""
+    def _on_synonym_enter(self, event, text: str, widget: tk.Widget):
+        """Hover-перевод для синонима (подсветку слова делает DictionaryRenderer)"""
         self._on_text_enter(event, text)
-        widget.config(bg=COLORS["text_accent"], fg=COLORS["bg"])
 
-    def _on_synonym_leave(self, event, widget: tk.Label):
+    def _on_synonym_leave(self, event, widget: tk.Widget):
         """Уход курсора с синонима"""
         self._on_text_leave(event)
-        widget.config(bg=COLORS["bg_secondary"], fg=COLORS["text_main"])
 
     # ===== DATA DISPLAY =====
 
@@ -719,9 +711,8 @@ class MainWindow(tk.Tk):
             bg=COLORS["bg"]
         )
 
-        # Очищаем область словаря и показываем skeleton loader
+        # Очищаем область словаря на время загрузки
         self.dict_renderer.clear()
-        self._show_skeleton_loader()
 
         # Сбрасываем источники
         self.sources = {"trans": "...", "img": "..."}
@@ -739,19 +730,6 @@ class MainWindow(tk.Tk):
         except Exception:
             pass
 
-    def _show_skeleton_loader(self):
-        """
-        Просто очищает область словаря (без графических полосок).
-        """
-        parent = getattr(self.dict_renderer, "parent", None)
-        if parent:
-            for w in parent.winfo_children():
-                w.destroy()
-
-            # Можно добавить простой текст, если хотите, или оставить пустым
-            # import tkinter as tk
-            # tk.Label(parent, text="Thinking...", font=("Segoe UI", 10), bg=COLORS["bg"], fg=COLORS["text_faint"]).pack(pady=20)
-
     # ===== WINDOW CONTROLS =====
 
     def resize_window(self, dx: int, dy: int):
@@ -782,8 +760,10 @@ class MainWindow(tk.Tk):
         new_w = self.winfo_width()
         new_h = self.winfo_height()
 
-        cfg.set("USER", "WindowWidth", new_w)
-        cfg.set("USER", "WindowHeight", new_h)
+        cfg.set_batch({
+            ("USER", "WindowWidth"): new_w,
+            ("USER", "WindowHeight"): new_h,
+        })
 
         # Обновляем wraplength после завершения resize
         self.lbl_rus.config(wraplength=new_w - 20)
@@ -897,8 +877,10 @@ class MainWindow(tk.Tk):
     def stop_move(self, event):
         """Завершение перемещения"""
         if self.dragging_allowed:
-            cfg.set("USER", "WindowX", self.winfo_x())
-            cfg.set("USER", "WindowY", self.winfo_y())
+            cfg.set_batch({
+                ("USER", "WindowX"): self.winfo_x(),
+                ("USER", "WindowY"): self.winfo_y(),
+            })
         self.dragging_allowed = False
 
     def close_app(self):
@@ -333,7 +333,9 @@ class SentenceWindow(tk.Toplevel):
         Скрывает окно БЕЗ анимации (для обратной совместимости).
         Для скрытия с анимацией используйте close_window().
         """
-        cfg.set("USER", "SentWindowGeometry", self.geometry())
-        cfg.set("USER", "ShowSentenceWindow", False)
+        cfg.set_batch({
+            ("USER", "SentWindowGeometry"): self.geometry(),
+            ("USER", "ShowSentenceWindow"): False,
+        })
         self.attributes("-alpha", 1.0)
         self.withdraw()
@@ -51,6 +51,7 @@ FONTS: Final[dict[str, tuple]] = {
     "phonetic": ("Consolas", 11),  # Phonetic transcription (monospace)
     "pos": ("Segoe UI", 10, "italic"),  # Part of speech
     "definition": ("Segoe UI", 11),  # Word definitions
+    "definition_italic": ("Segoe UI", 11, "italic"),  # Examples under definitions
     "example": ("Segoe UI", 10, "italic"),  # Usage examples
 
     # === SYNONYMS ===
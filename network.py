@@ -39,13 +39,21 @@ MIN_VALID_AUDIO_SIZE = 1500  # bytes, ~0.1s of MP3 audio
 MIN_IMAGE_DIMENSION = 100  # pixels, минимум для валидных изображений
 IMAGE_THUMBNAIL_SIZE = 500  # Pexels/Wiki API параметр
 
-# ===== ИМПОРТЫ С GRACEFUL DEGRADATION =====
-try:
-    from playsound import playsound
-    PLAYSOUND_AVAILABLE = True
-except ImportError:
-    playsound = None
-    PLAYSOUND_AVAILABLE = False
+# ===== ЛЕНИВЫЙ ИМПОРТ С GRACEFUL DEGRADATION =====
+@lru_cache(maxsize=1)
+def _get_playsound():
+    """
+    Импортирует playsound при первом воспроизведении, а не при старте.
+    playsound подтягивает платформенные аудио-бэкенды, что замедляет открытие окна.
+
+    Returns:
+        Функция playsound или None если библиотека недоступна
+    """
+    try:
+        from playsound import playsound
+        return playsound
+    except ImportError:
+        return None
 
 # ===== ОЧИСТКА СЛОВ =====
 @lru_cache(maxsize=2048)
@@ -139,10 +147,12 @@ def get_audio_cache_path(word: str, accent: str = "us") -> str:
     safe_word = get_safe_filename(word)
     return os.path.join(AUDIO_DIR, f"{safe_word}-{accent}.mp3")
 
+@lru_cache(maxsize=512)
 def get_temp_audio_path(text: str) -> str:
     """
     Возвращает путь к временному аудиофайлу на основе хэша текста.
     Используется для предложений/определений (use_cache=False).
+    Кэшируется: повторный клик по тому же определению не пересчитывает md5.
     """
     text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()[:16]
     return os.path.join(TEMP_AUDIO_DIR, f"{text_hash}.mp3")
@@ -352,7 +362,7 @@ def fetch_google_official_tts(text: str, use_cache: bool = True) -> Optional[str
 
 def streaming_play_and_cache(url: str, cache_path: str):
     """Потоковое воспроизведение с одновременным кэшированием"""
-    if not PLAYSOUND_AVAILABLE:
+    if _get_playsound() is None:
         return
 
     try:
@@ -390,7 +400,8 @@ def streaming_play_and_cache(url: str, cache_path: str):
 
 def _safe_play(path: str):
     """Безопасное воспроизведение с ожиданием готовности файла"""
-    if not PLAYSOUND_AVAILABLE or playsound is None:
+    playsound = _get_playsound()
+    if playsound is None:
         return
 
     max_attempts = 10
@@ -715,12 +726,15 @@ def clear_temp_audio() -> int:
     Returns:
         Количество удаленных файлов
     """
-    if not os.path.exists(TEMP_AUDIO_DIR):
+    try:
+        entries_cm = os.scandir(TEMP_AUDIO_DIR)
+    except OSError:
+        # Директории нет (FileNotFoundError) или нет доступа
         return 0
 
     deleted_count = 0
     try:
-        with os.scandir(TEMP_AUDIO_DIR) as entries:
+        with entries_cm as entries:
             for entry in entries:
                 if entry.is_file():
                     try:
@@ -793,7 +807,8 @@ def play_audio_safe(path: str):
     Безопасное воспроизведение аудиофайла.
     Не блокирует поток надолго (зависит от playsound) и глотает ошибки.
     """
-    if not PLAYSOUND_AVAILABLE or playsound is None:
+    playsound = _get_playsound()
+    if playsound is None:
         return
 
     try:
@@ -0,0 +1,43 @@
+"""
+Тесты объединения meanings в DictionaryRenderer (без создания виджетов).
+"""
+
+from gui.dict_renderer import DictionaryRenderer
+
+
+def _merge(meanings):
+    """Вызывает _merge_and_group без __init__ (Tk не нужен)"""
+    renderer = DictionaryRenderer.__new__(DictionaryRenderer)
+    return renderer._merge_and_group(meanings)
+
+
+def test_pos_without_definitions_first_keeps_position_and_synonyms():
+    # Блок verb без definitions идёт раньше блока verb с definitions
+    meanings = [
+        {"partOfSpeech": "verb", "definitions": [], "synonyms": ["go"], "antonyms": ["stay"]},
+        {"partOfSpeech": "noun", "definitions": [{"definition": "a run"}]},
+        {"partOfSpeech": "verb", "definitions": [{"definition": "to run"}], "synonyms": ["Go", "dash"]},
+    ]
+
+    merged, grouped = _merge(meanings)
+
+    # Позиция части речи — по первому появлению, а не по первым definitions
+    assert [m["partOfSpeech"] for m in merged] == ["verb", "noun"]
+
+    verb = merged[0]
+    assert verb["definitions"] == [{"definition": "to run", "example": ""}]
+    assert verb["synonyms"] == ["go", "dash"]
+    assert verb["antonyms"] == ["stay"]
+    assert grouped["verb"] is verb
+
+
+def test_pos_never_getting_definitions_is_dropped():
+    meanings = [
+        {"partOfSpeech": "adverb", "definitions": [], "synonyms": ["fast"]},
+        {"partOfSpeech": "noun", "definitions": [{"definition": "a thing"}]},
+    ]
+
+    merged, grouped = _merge(meanings)
+
+    assert [m["partOfSpeech"] for m in merged] == ["noun"]
+    assert grouped["adverb"] is None
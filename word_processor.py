@@ -34,14 +34,6 @@ from network import (
     _audio_play_lock
 )
 
-# Graceful degradation для playsound
-try:
-    from playsound import playsound
-    PLAYSOUND_AVAILABLE = True
-except ImportError:
-    playsound = None
-    PLAYSOUND_AVAILABLE = False
-
 
 class WordProcessor:
     """